@@ -1085,6 +1085,19 @@ class sfwExpr(Expr):
 
         See also general, partfrac, mixedfrac, and ZPK"""
 
+        expr = self.expr
+        if expr.is_rational_function(self.var):
+            # Rational functions need no delay handling; together plus
+            # cancel is cheaper than the full polynomial decomposition
+            # and only the denominator needs to be made monic.
+            expr = sym.cancel(sym.together(expr), self.var)
+            numer, denom = expr.as_numer_denom()
+            D = sym.Poly(denom, self.var)
+            LC = D.LC()
+            if LC != 1:
+                expr = (numer / LC) / D.monic().as_expr()
+            return self.__class__(expr, **self.assumptions)
+
         try:
             N, D, delay = self._as_ratfun_delay()
         except ValueError:
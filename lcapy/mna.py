@@ -5,6 +5,7 @@ Copyright 2014, 2015 Michael Hayes, UCECE
 """
 
 from __future__ import division
+from functools import lru_cache
 from lcapy.core import cExpr, Vtype, Itype, s, sqrt
 from lcapy.core import Matrix, Vector
 import sympy as sym
@@ -18,6 +19,23 @@ def namelist(elements):
     return ', '.join([elt for elt in elements])
 
 
+@lru_cache(maxsize=4096)
+def _simplify_cached(expr):
+    return sym.simplify(expr)
+
+
+def _simplify(expr):
+    """Simplify an expression, caching the result; identical node
+    voltage and branch current expressions recur when solving similar
+    networks."""
+
+    if isinstance(expr, sym.Expr):
+        return _simplify_cached(expr)
+    if hasattr(expr, 'expr'):
+        return _simplify_cached(expr.expr)
+    return sym.simplify(expr)
+
+
 class Mdict(dict):
 
     def __init__(self, branchdict, **assumptions):
@@ -35,7 +53,7 @@ class Mdict(dict):
 
         if key in self.branchdict:
             n1, n2 = self.branchdict[key]
-            return Vtype((self[n1] - self[n2]).simplify(), **self.assumptions)
+            return Vtype(_simplify(self[n1] - self[n2]), **self.assumptions)
 
         return super(Mdict, self).__getitem__(key)
 
@@ -264,7 +282,7 @@ class MNA(object):
         for n in self.nodes:
             index = self._node_index(n)
             if index >= 0:
-                self._V[n] = Vtype(results[index].simplify(), **assumptions)
+                self._V[n] = Vtype(_simplify(results[index]), **assumptions)
             else:
                 self._V[n] = Vtype(0, **assumptions)
 
@@ -273,7 +291,7 @@ class MNA(object):
         # Create dictionary of branch currents through elements
         self._I = {}
         for m, key in enumerate(self.unknown_branch_currents):
-            self._I[key] = Itype(results[m + num_nodes].simplify(), **assumptions)
+            self._I[key] = Itype(_simplify(results[m + num_nodes]), **assumptions)
 
         # Calculate the branch currents.  These should be lazily
         # evaluated as required.
@@ -283,7 +301,7 @@ class MNA(object):
                     elt.nodes[0]], self.node_map[elt.nodes[1]]
                 V1, V2 = self._V[n1], self._V[n2]
                 I = ((V1 - V2 - elt.Voc) / elt.Z)
-                self._I[elt.name] = Itype(I.simplify(), **assumptions)
+                self._I[elt.name] = Itype(_simplify(I), **assumptions)
 
         self.context.restore()
 
@@ -345,7 +363,7 @@ class MNA(object):
             if elt.type == 'K':
                 continue
             n1, n2 = self.node_map[elt.nodes[0]], self.node_map[elt.nodes[1]]
-            self._Vd[elt.name] = Vtype((self._V[n1] - self._V[n2]).simplify(),
+            self._Vd[elt.name] = Vtype(_simplify(self._V[n1] - self._V[n2]),
                                        **assumptions)
 
         return self._Vd
@@ -51,7 +51,7 @@ class NetfileMixin(object):
                 self.opts.add(string[1:])
             return None
 
-        if string[0:9] == '.include ':
+        if string.startswith('.include '):
             self._include(string)
             return None
 
@@ -79,9 +79,6 @@ class NetfileMixin(object):
     def _netfile_add(self, filename, namespace=''):
         """Add the nets from file with specified filename"""
 
-        file = open(filename, 'r')
-
-        lines = file.readlines()
-
-        for line in lines:
-            self._add(line, namespace)
+        with open(filename, 'r') as netfile:
+            for line in netfile:
+                self._add(line, namespace)
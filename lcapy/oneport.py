@@ -27,6 +27,8 @@ Copyright 2014, 2015, 2016 Michael Hayes, UCECE
 """
 
 from __future__ import division
+from functools import lru_cache, singledispatch
+from weakref import WeakValueDictionary
 import sympy as sym
 from lcapy.core import t, s, Vs, Is, Zs, Ys, cExpr, sExpr, tExpr, tsExpr, cos, exp, symbol, j, Vphasor, Iphasor, It, Itype, Vtype, pretty
 from lcapy.sympify import symbols_find
@@ -45,6 +47,118 @@ def _check_oneport_args(args):
             raise ValueError('%s not a OnePort' % arg1)
 
 
+# Components constructed from a single scalar (R, G, Y, Z, and the
+# sources) record whether that scalar is zero in the _is_zero
+# attribute.  This lets simplify() and the Thevenin/Norton
+# transformations detect identity components, such as V(0) in series
+# or I(0) in parallel, without a symbolic comparison.
+
+
+# Components that set _intern share a single instance per distinct
+# args tuple.  They are immutable once constructed so trees rebuilt by
+# simplify(), expand(), and smodel() reuse the symbolic work done when
+# a repeated component, say R(1), was first created.  The weak values
+# let unused components be reclaimed as usual.
+_cpt_cache = WeakValueDictionary()
+
+
+# Converting a constructor argument to an Expr runs SymPy's sympify
+# parser, the dominant cost when the same component values recur.
+# Plain numbers are safe to cache; strings and symbolic expressions
+# are not, since sympifying them registers their symbols with the
+# current circuit context.  The class is part of the key so 1 and 1.0
+# do not alias.
+
+@lru_cache(maxsize=4096)
+def _cexpr_cached(cls, arg, positive):
+    # Plain numbers need no parsing and carry their sign by value, so
+    # build the sympy atom directly and bypass the sympify parser.
+    if cls is int:
+        return cExpr(sym.Integer(arg))
+    if cls is float:
+        return cExpr(sym.Float(arg))
+    return cExpr(arg, positive=positive)
+
+
+def _cexpr(arg, positive=False):
+    if isinstance(arg, (int, float)):
+        return _cexpr_cached(arg.__class__, arg, positive)
+    return cExpr(arg, positive=positive)
+
+
+@lru_cache(maxsize=4096)
+def _tsexpr_cached(cls, arg):
+    return tsExpr(arg)
+
+
+def _tsexpr(arg):
+    if isinstance(arg, (int, float)):
+        return _tsexpr_cached(arg.__class__, arg)
+    return tsExpr(arg)
+
+
+# The one-sided Laplace transform runs a symbolic integral; the
+# time-domain sources cache it keyed on the transformed expression so
+# repeated construction from the same waveform skips the integration.
+_laplace_cache = {}
+
+
+def _laplace(texpr):
+
+    key = texpr.expr
+    try:
+        return _laplace_cache[key]
+    except KeyError:
+        pass
+
+    result = texpr.laplace()
+    _laplace_cache[key] = result
+    return result
+
+
+# s-domain transforms of cos(omega t + phi) for the AC sources, keyed
+# on (omega, phi).  Circuits commonly have many AC sources with the
+# same phase (usually zero) and building the trigonometric expression
+# is not cheap.
+_ac_kernel_cache = {}
+
+
+def _ac_kernel(omega, phi):
+
+    key = (omega, phi.expr)
+    try:
+        return _ac_kernel_cache[key]
+    except KeyError:
+        pass
+
+    if phi == 0:
+        # Skip the cos/sin construction for the common zero phase.
+        foo = s / (s**2 + omega**2)
+    else:
+        # Note, cos(-pi / 2) is not quite zero.
+        foo = (s * sym.cos(phi) + omega * sym.sin(phi)) / (s**2 + omega**2)
+
+    _ac_kernel_cache[key] = foo
+    return foo
+
+
+# Shared zero constants; sources construct these on every
+# instantiation otherwise.  They also serve as the default argument
+# values so identity checks against them work.
+_ZS_ZERO = Zs(0)
+_YS_ZERO = Ys(0)
+_VS_ZERO = Vs(0)
+_IS_ZERO = Is(0)
+
+# Every AC source uses the same angular frequency symbol so create it
+# once at import time.
+_OMEGA_1 = symbol('omega_1', real=True)
+
+# Shared 1 / s factor for the step and dc sources; multiplying by this
+# avoids building a new Pow(s, -1) per construction.
+_INV_S = 1 / s
+
+
 class OnePort(Network):
     """One-port network
 
@@ -63,25 +177,61 @@ class OnePort(Network):
     netname = ''
     netkeyword = ''
 
+    # See _cpt_cache; _initialized lets an interned component skip
+    # re-running __init__ on a cache hit.
+    _intern = False
+    _initialized = False
+
+    def __new__(cls, *args, **kwargs):
+
+        if not cls._intern:
+            return super(OnePort, cls).__new__(cls)
+
+        # Only intern components with plain numeric args.  Symbolic
+        # args register their symbols with the current circuit context
+        # as a side effect of construction, which a cache hit would
+        # skip.
+        for arg in args:
+            if not isinstance(arg, (int, float)):
+                return super(OnePort, cls).__new__(cls)
+
+        # Key on the argument types as well as their values so, say,
+        # R(10) and R(10.0) do not alias.
+        key = (cls, tuple((type(arg), arg) for arg in args),
+               tuple(sorted(kwargs.items())))
+        cpt = _cpt_cache.get(key)
+        if cpt is None:
+            cpt = super(OnePort, cls).__new__(cls)
+            _cpt_cache[key] = cpt
+        return cpt
+
+    # Chains of + and | are flattened as they are built so that
+    # simplification and analysis walk a single flat Ser/Par rather
+    # than a left-nested tree.
+
     def __add__(self, OP):
         """Series combination"""
 
+        if isinstance(OP, Ser):
+            return Ser(self, *OP.args)
         return Ser(self, OP)
 
     def __or__(self, OP):
         """Parallel combination"""
 
+        if isinstance(OP, Par):
+            return Par(self, *OP.args)
         return Par(self, OP)
 
     def series(self, OP):
         """Series combination"""
 
-        return Ser(self, OP)
+        return self + OP
 
     def parallel(self, OP):
         """Parallel combination"""
 
-        return Par(self, OP)
+        return self | OP
 
     @property
     def Zoc(self):
@@ -91,6 +241,29 @@ class OnePort(Network):
     def Ysc(self):
         return self.Y
 
+    # The source classification of a OnePort depends only on the
+    # immutable args so cache it; thevenin(), norton(), and the
+    # recursive smodel()/simplify() walks query these repeatedly and
+    # each evaluation scans the generated netlist.
+
+    @property
+    def is_dc(self):
+        if not hasattr(self, '_is_dc'):
+            self._is_dc = Network.is_dc.fget(self)
+        return self._is_dc
+
+    @property
+    def is_ac(self):
+        if not hasattr(self, '_is_ac'):
+            self._is_ac = Network.is_ac.fget(self)
+        return self._is_ac
+
+    @property
+    def is_causal(self):
+        if not hasattr(self, '_is_causal'):
+            self._is_causal = Network.is_causal.fget(self)
+        return self._is_causal
+
     def ladder(self, *args):
         """Create (unbalanced) ladder network"""
 
@@ -99,7 +272,7 @@ class OnePort(Network):
     def lsection(self, OP2):
         """Create L section (voltage divider)"""
 
-        if not issubclass(OP2.__class__, OnePort):
+        if not isinstance(OP2, OnePort):
             raise TypeError('Argument not ', OnePort)
 
         return LSection(self, OP2)
@@ -107,21 +280,21 @@ class OnePort(Network):
     def tsection(self, OP2, OP3):
         """Create T section"""
 
-        if not issubclass(OP2.__class__, OnePort):
+        if not isinstance(OP2, OnePort):
             raise TypeError('Argument not ', OnePort)
 
-        if not issubclass(OP3.__class__, OnePort):
+        if not isinstance(OP3, OnePort):
             raise TypeError('Argument not ', OnePort)
 
         return TSection(self, OP2, OP3)
 
     def expand(self):
 
-        return self
+        return self._expand_impl({})
 
-    def smodel(self):
-        """Convert to s-domain"""
-        raise NotImplemented('smodel not implemented')
+    def _expand_impl(self, memo):
+
+        return self
 
     @property
     def voc(self):
@@ -195,9 +368,15 @@ class OnePort(Network):
         if not isinstance(Z1, OnePort):
             Z1 = Z(Z1)
 
-        if V1.Voc == 0:
+        V1_zero = getattr(V1, '_is_zero', None)
+        if V1_zero is None:
+            V1_zero = V1.Voc == 0
+        if V1_zero:
             return Z1
-        if Z1.Z == 0:
+        Z1_zero = getattr(Z1, '_is_zero', None)
+        if Z1_zero is None:
+            Z1_zero = Z1.Z == 0
+        if Z1_zero:
             return V1
 
         return Ser(Z1, V1)
@@ -222,38 +401,57 @@ class OnePort(Network):
             if not isinstance(Y1, OnePort):
                 Y1 = G(Y1)
 
-        if I1.Isc == 0:
+        I1_zero = getattr(I1, '_is_zero', None)
+        if I1_zero is None:
+            I1_zero = I1.Isc == 0
+        if I1_zero:
             return Y1
-        if Y1.Y == 0:
+        Y1_zero = getattr(Y1, '_is_zero', None)
+        if Y1_zero is None:
+            Y1_zero = Y1.Y == 0
+        if Y1_zero:
             return I1
 
         return Par(Y1, I1)
 
     def smodel(self):
         """Convert to s-domain"""
-        args = [arg.smodel() for arg in self.args]
-        return (self.__class__(*args))
+        return self._smodel_impl({})
+
+    def _smodel_impl(self, memo):
+        # Memoise on object identity so a sub-network referenced
+        # several times by the same tree is converted only once.
+        key = id(self)
+        if key in memo:
+            return memo[key]
+        args = [arg._smodel_impl(memo) for arg in self.args]
+        result = self.__class__(*args)
+        memo[key] = result
+        return result
 
 
 class ParSer(OnePort):
     """Parallel/serial class"""
 
-    def __str__(self):
-
-        str = ''
+    def _format_args(self, render):
+        """Render each arg with the supplied callable and join with the
+        operator, parenthesising args of a different ParSer class."""
 
-        for m, arg in enumerate(self.args):
-            argstr = arg.__str__()
+        cls = self.__class__
+        parts = []
+        for arg in self.args:
+            argstr = render(arg)
 
-            if isinstance(arg, ParSer) and arg.__class__ != self.__class__:
+            if isinstance(arg, ParSer) and arg.__class__ != cls:
                 argstr = '(' + argstr + ')'
 
-            str += argstr
+            parts.append(argstr)
+
+        return (' %s ' % self._operator).join(parts)
 
-            if m != len(self.args) - 1:
-                str += ' %s ' % self._operator
+    def __str__(self):
 
-        return str
+        return self._format_args(str)
 
     def _repr_pretty_(self, p, cycle):
 
@@ -265,20 +463,7 @@ class ParSer(OnePort):
 
     def pretty(self):
 
-        str = ''
-
-        for m, arg in enumerate(self.args):
-            argstr = arg.pretty()
-
-            if isinstance(arg, ParSer) and arg.__class__ != self.__class__:
-                argstr = '(' + argstr + ')'
-
-            str += argstr
-
-            if m != len(self.args) - 1:
-                str += ' %s ' % self._operator
-
-        return str
+        return self._format_args(lambda arg: arg.pretty())
 
     def pprint(self):
 
@@ -286,94 +471,64 @@ class ParSer(OnePort):
 
     def latex(self):
 
-        str = ''
-
-        for m, arg in enumerate(self.args):
-            argstr = arg.latex()
-
-            if isinstance(arg, ParSer) and arg.__class__ != self.__class__:
-                argstr = '(' + argstr + ')'
-
-            str += argstr
+        return self._format_args(lambda arg: arg.latex())
 
-            if m != len(self.args) - 1:
-                str += ' %s ' % self._operator
+    @classmethod
+    def _rebuild(cls, args):
+        """Construct a Par/Ser from args produced by an already
+        constructed parent, skipping the argument checks and the
+        source-conflict scan performed by __init__."""
 
-        return str
+        obj = cls.__new__(cls)
+        # Establish the Netlist state (nodes, elements, context) that
+        # __init__ would have set up; without it attribute probes on
+        # the rebuilt network recurse through Netlist.__getattr__.
+        super(ParSer, obj).__init__()
+        obj.args = tuple(args)
+        obj._n = len(obj.args)
+        return obj
 
     def _combine(self, arg1, arg2):
 
         if arg1.__class__ != arg2.__class__:
             if self.__class__ == Ser:
-                if isinstance(arg1, V) and arg1.Voc == 0:
+                if _is_identity_ser(arg1):
                     return arg2
-                if isinstance(arg2, V) and arg2.Voc == 0:
-                    return arg1
-                if isinstance(arg1, Z) and arg1.Z == 0:
-                    return arg2
-                if isinstance(arg2, Z) and arg2.Z == 0:
+                if _is_identity_ser(arg2):
                     return arg1
             if self.__class__ == Par:
-                if isinstance(arg1, I) and arg1.Isc == 0:
-                    return arg2
-                if isinstance(arg2, I) and arg2.Isc == 0:
-                    return arg1
-                if isinstance(arg1, Y) and arg1.Y == 0:
+                if _is_identity_par(arg1):
                     return arg2
-                if isinstance(arg2, Y) and arg2.Y == 0:
+                if _is_identity_par(arg2):
                     return arg1
 
             return None
 
-        if self.__class__ == Ser:
-            if isinstance(arg1, I):
-                return None
-            if isinstance(arg1, Vdc):
-                return Vdc(arg1.v0 + arg2.v0)
-            # Could simplify Vac here if same frequency
-            if isinstance(arg1, V):
-                return V(arg1 + arg2)
-            if isinstance(arg1, R):
-                return R(arg1.R + arg2.R)
-            if isinstance(arg1, L):
-                # The currents should be the same!
-                if arg1.i0 != arg2.i0:
-                    raise ValueError('Series inductors with different'
-                          ' initial currents!')
-                return L(arg1.L + arg2.L, arg1.i0)
-            if isinstance(arg1, G):
-                return G(arg1.G * arg2.G / (arg1.G + arg2.G))
-            if isinstance(arg1, C):
-                return C(
-                    arg1.C * arg2.C / (arg1.C + arg2.C), arg1.v0 + arg2.v0)
-            return None
+        return self._combine_many((arg1, arg2))
 
-        elif self.__class__ == Par:
-            if isinstance(arg1, V):
-                return None
-            if isinstance(arg1, Idc):
-                return Idc(arg1.i0 + arg2.i0)
-            # Could simplify Iac here if same frequency
-            if isinstance(arg1, I):
-                return I(arg1 + arg2)
-            if isinstance(arg1, G):
-                return G(arg1.G + arg2.G)
-            if isinstance(arg1, C):
-                # The voltages should be the same!
-                if arg1.v0 != arg2.v0:
-                    raise ValueError('Parallel capacitors with different'
-                          ' initial voltages!')
-                return C(arg1.C + arg2.C, arg1.v0)
-            if isinstance(arg1, R):
-                return R(arg1.R * arg2.R / (arg1.R + arg2.R))
-            if isinstance(arg1, L):
-                return L(
-                    arg1.L * arg2.L / (arg1.L + arg2.L), arg1.i0 + arg2.i0)
-            return None
+    def _combine_many(self, args):
+        """Combine a list of components of the same class in a single
+        step, returning the combined component or None if the class
+        cannot be reduced for this connection.
+
+        Unlike repeated pairwise _combine calls, this folds the
+        component values directly so an N element bucket builds one
+        new component instead of N - 1 intermediates.  The combiners
+        are dispatched from a table keyed on the component class; see
+        _ser_combiners and _par_combiners at the end of this module."""
 
+        if self.__class__ == Ser:
+            table = _ser_combiners
+        elif self.__class__ == Par:
+            table = _par_combiners
         else:
             raise TypeError('Undefined class')
 
+        combiner = table.get(args[0].__class__)
+        if combiner is None:
+            return None
+        return combiner(args)
+
     def simplify(self, deep=True):
         """Perform simple simplifications, such as parallel resistors,
         series inductors, etc., rather than collapsing to a Thevenin
@@ -387,7 +542,7 @@ class ParSer(OnePort):
         # Par(Par(A, B), C) etc.
         new = False
         newargs = []
-        for m, arg in enumerate(self.args):
+        for arg in self.args:
             if isinstance(arg, ParSer):
                 arg = arg.simplify(deep)
                 new = True
@@ -399,46 +554,68 @@ class ParSer(OnePort):
                 newargs.append(arg)
 
         if new:
-            self = self.__class__(*newargs)
+            self = self._rebuild(newargs)
 
-        # Scan arg list looking for compatible combinations.
-        # Could special case the common case of two args.
-        new = False
-        args = list(self.args)
-        for n in range(len(args)):
+        # Scan arg list looking for compatible combinations.  Since
+        # only args of the same class can be merged, bucket the args
+        # by class and fold each bucket in one step rather than
+        # scanning all pairs.
 
-            arg1 = args[n]
-            if arg1 is None:
-                continue
-            if isinstance(arg1, ParSer):
+        # TODO, think how to simplify things such as
+        # Par(Ser(V1, R1), Ser(R2, V2)).
+        # Could do Thevenin/Norton transformations.
+
+        buckets = {}
+        order = []
+        for arg in self.args:
+
+            if isinstance(arg, ParSer):
+                order.append(arg)
                 continue
 
-            for m in range(n + 1, len(args)):
+            bucket = buckets.get(arg.__class__)
+            if bucket is None:
+                buckets[arg.__class__] = bucket = [arg]
+                order.append(bucket)
+            else:
+                bucket.append(arg)
 
-                arg2 = args[m]
-                if arg2 is None:
-                    continue
-                if isinstance(arg2, ParSer):
-                    continue
+        new = False
+        args = []
+        for item in order:
 
-                # TODO, think how to simplify things such as
-                # Par(Ser(V1, R1), Ser(R2, V2)).
-                # Could do Thevenin/Norton transformations.
+            if not isinstance(item, list):
+                args.append(item)
+                continue
+            if len(item) == 1:
+                args.append(item[0])
+                continue
+
+            newarg = self._combine_many(item)
+            if newarg is None:
+                args.extend(item)
+            else:
+                # print('Combining', item, 'to', newarg)
+                args.append(newarg)
+                new = True
 
-                newarg = self._combine(arg1, arg2)
-                if newarg is not None:
-                    # print('Combining', arg1, arg2, 'to', newarg)
-                    args[m] = None
-                    arg1 = newarg
-                    new = True
+        # Remove identity components, such as a zero voltage source in
+        # series or a zero current source in parallel, that the
+        # bucketing cannot merge since the classes differ.
+        if len(args) > 1:
+            if self.__class__ == Ser:
+                pruned = [arg for arg in args if not _is_identity_ser(arg)]
+            else:
+                pruned = [arg for arg in args if not _is_identity_par(arg)]
 
-            args[n] = arg1
+            if len(pruned) != len(args):
+                args = pruned if pruned != [] else [args[-1]]
+                new = True
 
         if new:
-            args = [arg for arg in args if arg is not None]
             if len(args) == 1:
                 return args[0]
-            self = self.__class__(*args)
+            self = self._rebuild(args)
 
         return self
 
@@ -446,43 +623,78 @@ class ParSer(OnePort):
         """Expand compound components such as crystals or ferrite bead
         models into R, L, G, C, V, I"""
 
-        newargs = []
-        for m, arg in enumerate(self.args):
-            newarg = arg.expand()
-            newargs.append(newarg)
+        return self._expand_impl({})
 
-        return self.__class__(*newargs)
+    def _expand_impl(self, memo):
 
-    def smodel(self):
-        """Convert to s-domain"""
-        args = [arg.smodel() for arg in self.args]
-        return (self.__class__(*args))
+        key = id(self)
+        if key in memo:
+            return memo[key]
+        newargs = [arg._expand_impl(memo) for arg in self.args]
+        result = self.__class__(*newargs)
+        memo[key] = result
+        return result
+
+    # The args of a ParSer are fixed at construction so the following
+    # quantities are cached; each otherwise requires a circuit solve.
 
     @property
     def Isc(self):
 
+        if hasattr(self, '_Isc'):
+            return self._Isc
+
         Voc = self.Voc
         Z = self.Z
         assumptions = Voc.assumptions
-        return Itype(Voc / Z, **assumptions)
+        self._Isc = Itype(Voc / Z, **assumptions)
+        return self._Isc
 
     @property
     def Voc(self):
+
+        if hasattr(self, '_Voc'):
+            return self._Voc
+
         self._solve()
         Voc = self._V[1]
         # FIXME
         assumptions = self._V.assumptions
-        return Vtype(Voc, **assumptions)
+        self._Voc = Vtype(Voc, **assumptions)
+        return self._Voc
+
+    def voc_cse(self):
+        """Return the open-circuit voltage with repeated sub-expressions
+        factored out using common sub-expression elimination.
+
+        The result is a tuple (defs, expr) where defs is a list of
+        (symbol, sub-expression) pairs and expr is the open-circuit
+        voltage written in terms of those symbols.  This form is much
+        cheaper to evaluate or print when the network repeats terms
+        such as s**2 + omega**2."""
+
+        if hasattr(self, '_Voc_cse'):
+            return self._Voc_cse
+
+        defs, reduced = sym.cse(self.Voc.expr)
+        self._Voc_cse = (defs, reduced[0])
+        return self._Voc_cse
 
     @property
     def Y(self):
         # Could extract directly if have Y || I or Z + V
-        return self.admittance(1, 0)
+        # Note, _Y and _Z are used by the MNA solver so the caches
+        # need different names.
+        if not hasattr(self, '_Ysc'):
+            self._Ysc = self.admittance(1, 0)
+        return self._Ysc
 
     @property
     def Z(self):
         # Could extract directly if have Y || I or Z + V
-        return self.impedance(1, 0)
+        if not hasattr(self, '_Zoc'):
+            self._Zoc = self.impedance(1, 0)
+        return self._Zoc
 
 class Par(ParSer):
     """Parallel class"""
@@ -494,35 +706,55 @@ class Par(ParSer):
         _check_oneport_args(args)
         super(Par, self).__init__()
         self.args = args
+        self._n = len(args)
+
+        # Construction should stay cheap; no solving is performed
+        # until a Thevenin/Norton quantity is requested.
+        vsources = [arg for arg in args if isinstance(arg, V)]
+        if len(vsources) > 1:
+            raise ValueError('Voltage sources connected in parallel'
+                             ' %s and %s' % (vsources[0], vsources[1]))
+        if vsources != [] and len(args) > 1:
+            # Should simplify by removing redundant component to
+            # save later grief with Norton or Thevenin transformation.
+            print('Warn: parallel connection with voltage source: %s' %
+                  vsources[0])
 
-        for n, arg1 in enumerate(self.args):
-            for arg2 in self.args[n + 1:]:
-                if isinstance(arg1, V) and isinstance(arg2, V):
-                    raise ValueError('Voltage sources connected in parallel'
-                                     ' %s and %s' % (arg1, arg2))
-                if isinstance(arg1, V) or isinstance(arg2, V):
-                    # Should simplify by removing redundant component to
-                    # save later grief with Norton or Thevenin transformation.
-                    print('Warn: parallel connection with voltage source:'
-                          ' %s and %s' % (arg1, arg2))
+    def __or__(self, OP):
+        """Parallel combination, extending this parallel network"""
+
+        if isinstance(OP, Par):
+            return Par(*(self.args + OP.args))
+        return Par(*(self.args + (OP, )))
+
+    # The schematic geometry of the subtree is fixed by the args so
+    # cache it; net_make otherwise rewalks the whole tree per access.
 
     @property
     def width(self):
 
+        if hasattr(self, '_width'):
+            return self._width
+
         total = 0
         for arg in self.args:
             val = arg.width
             if val > total:
                 total = val
-        return total + 2 * self.wsep
+        self._width = total + 2 * self.wsep
+        return self._width
 
     @property
     def height(self):
 
+        if hasattr(self, '_height'):
+            return self._height
+
         total = 0
         for arg in self.args:
             total += arg.height
-        return total + (len(self.args) - 1) * self.hsep
+        self._height = total + (self._n - 1) * self.hsep
+        return self._height
 
     def net_make(self, net, n1=None, n2=None):
 
@@ -531,48 +763,48 @@ class Par(ParSer):
             n1 = net.node
         n3, n4 =  net.node, net.node
 
-        H = [(arg.height + self.hsep) * 0.5 for arg in self.args]
-        
+        args = self.args
+        H = [(arg.height + self.hsep) * 0.5 for arg in args]
+
         N = len(H)
-        num_branches = N // 2
+        mid = N // 2
 
         # Draw component in centre if have odd number in parallel.
         if (N & 1):
-            s.append(self.args[N // 2].net_make(net, n3, n4))
-
-        na, nb = n3, n4
+            s.append(args[mid].net_make(net, n3, n4))
 
         s.append('W %s %s; right=%s' % (n1, n3, self.wsep))
 
-        # Draw components above centre
-        for n in range(num_branches):
-
-            if not (N & 1) and n == 0:
-                sep = H[N // 2 - 1]
-            else:
-                sep = H[N // 2 - n] + H[N // 2 - 1 - n]
+        # The separation between adjacent branches is half the height
+        # of each plus half the centre component if there is one.
+        # Pre-slice the branches either side of the centre so the loop
+        # index arithmetic disappears.
+        above = list(zip(reversed(args[:mid]), reversed(H[:mid])))
+        below = list(zip(args[(N + 1) // 2:], H[(N + 1) // 2:]))
 
+        # Draw components above centre
+        na, nb = n3, n4
+        prev = H[mid] if (N & 1) else 0
+        for arg, h in above:
+            sep = h + prev
             nc, nd =  net.node, net.node
             s.append('W %s %s; up=%s' % (na, nc, sep))
             s.append('W %s %s; up=%s' % (nb, nd, sep))
-            s.append(self.args[N // 2 - 1 - n].net_make(net, nc, nd))
+            s.append(arg.net_make(net, nc, nd))
             na, nb = nc, nd
-
-        na, nb = n3, n4
+            prev = h
 
         # Draw components below centre
-        for n in range(num_branches):
-
-            if not (N & 1) and n == 0:
-                sep = H[(N + 1) // 2]
-            else:
-                sep = H[(N + 1) // 2 + n] + H[(N + 1) // 2 - 1 + n]
-
+        na, nb = n3, n4
+        prev = H[mid] if (N & 1) else 0
+        for arg, h in below:
+            sep = h + prev
             nc, nd =  net.node, net.node
             s.append('W %s %s; down=%s' % (na, nc, sep))
             s.append('W %s %s; down=%s' % (nb, nd, sep))
-            s.append(self.args[(N + 1) // 2 + n].net_make(net, nc, nd))
+            s.append(arg.net_make(net, nc, nd))
             na, nb = nc, nd
+            prev = h
 
         if n2 is None:
             n2 = net.node
@@ -591,42 +823,62 @@ class Ser(ParSer):
         _check_oneport_args(args)
         super(Ser, self).__init__()
         self.args = args
+        self._n = len(args)
+
+        # Construction should stay cheap; no solving is performed
+        # until a Thevenin/Norton quantity is requested.
+        isources = [arg for arg in args if isinstance(arg, I)]
+        if len(isources) > 1:
+            raise ValueError('Current sources connected in series'
+                             ' %s and %s' % (isources[0], isources[1]))
+        if isources != [] and len(args) > 1:
+            # Should simplify by removing redundant component to
+            # save later grief with Norton or Thevenin transformation.
+            print('Warn: series connection with current source: %s' %
+                  isources[0])
 
-        for n, arg1 in enumerate(self.args):
-            for arg2 in self.args[n + 1:]:
-                if isinstance(arg1, I) and isinstance(arg2, I):
-                    raise ValueError('Current sources connected in series'
-                                     ' %s and %s' % (arg1, arg2))
-                if isinstance(arg1, I) or isinstance(arg2, I):
-                    # Should simplify by removing redundant component to
-                    # save later grief with Norton or Thevenin transformation.
-                    print('Warn: series connection with current source:'
-                          ' %s and %s' % (arg1, arg2))
+    def __add__(self, OP):
+        """Series combination, extending this series network"""
+
+        if isinstance(OP, Ser):
+            return Ser(*(self.args + OP.args))
+        return Ser(*(self.args + (OP, )))
+
+    # See Par; the geometry is cached since the args are fixed.
 
     @property
     def height(self):
 
+        if hasattr(self, '_height'):
+            return self._height
+
         total = 0
         for arg in self.args:
             val = arg.height
             if val > total:
                 total = val
-        return total
+        self._height = total
+        return self._height
 
     @property
     def width(self):
 
+        if hasattr(self, '_width'):
+            return self._width
+
         total = 0
         for arg in self.args:
             total += arg.width
-        return total + (len(self.args) - 1) * self.wsep
+        self._width = total + (self._n - 1) * self.wsep
+        return self._width
 
     def net_make(self, net, n1=None, n2=None):
 
         s = []
+        args = self.args
         if n1 is None:
             n1 = net.node
-        for arg in self.args[:-1]:
+        for arg in args[:-1]:
             n3 = net.node
             s.append(arg.net_make(net, n1, n3))
             n1 = net.node
@@ -634,7 +886,7 @@ class Ser(ParSer):
 
         if n2 is None:
             n2 = net.node
-        s.append(self.args[-1].net_make(net, n1, n2))
+        s.append(args[-1].net_make(net, n1, n2))
         return '\n'.join(s)
 
 
@@ -658,7 +910,7 @@ class Norton(OnePort):
           +              V1                 -
     """
 
-    def __init__(self, Yval=Ys(0), Ival=Is(0)):
+    def __init__(self, Yval=_YS_ZERO, Ival=_IS_ZERO):
 
         # print('<N> Y:', Yval, 'I:', Ival)
         if not isinstance(Yval, Ys):
@@ -670,50 +922,77 @@ class Norton(OnePort):
 
         super(Norton, self).__init__()
 
+    # Y and Isc are stored by __init__; the derived quantities are
+    # cached since the components are immutable and tests and the
+    # network transformations read them repeatedly.
+
     @property
     def Z(self):
-        return Zs(1 / self.Y)
+        if not hasattr(self, '_Zoc'):
+            self._Zoc = Zs(1 / self.Y)
+        return self._Zoc
 
     @property
     def Voc(self):
-        return Vtype(self.Isc / self.Y, **self.Isc.assumptions)
+        if not hasattr(self, '_Voc'):
+            self._Voc = Vtype(self.Isc / self.Y, **self.Isc.assumptions)
+        return self._Voc
 
     def cpt(self):
         """Convert to a component, if possible"""
 
-        if self.Y.is_number and self.Isc == 0:
+        # The s * products are only formed in the branches that need
+        # them; the common conductance case returns after a single
+        # comparison.
+        Isc_zero = self.Isc == 0
+
+        if self.Y.is_number and Isc_zero:
             return G(self.Y.expr)
 
-        i = s * self.Isc
-        if self.Y == 0 and i.is_number:
-            return Idc(i.expr)
+        i = None
+        if self.Y == 0:
+            i = s * self.Isc
+            if i.is_number:
+                return Idc(i.expr)
 
-        v = s * self.Voc
-        if self.Z == 0 and v.is_number:
-            return Vdc(v.expr)
+        v = None
+        if self.Z == 0:
+            v = s * self.Voc
+            if v.is_number:
+                return Vdc(v.expr)
 
-        y = s * self.Y
         z = s * self.Z
+        if z.is_number:
+            if v is None:
+                v = s * self.Voc
+            if v.is_number:
+                return C((1 / z).expr, v)
 
-        if z.is_number and v.is_number:
-            return C((1 / z).expr, v)
-
-        if y.is_number and i.is_number:
-            return L((1 / y).expr, i)
+        y = s * self.Y
+        if y.is_number:
+            if i is None:
+                i = s * self.Isc
+            if i.is_number:
+                return L((1 / y).expr, i)
 
-        if self.Isc == 0:
+        if Isc_zero:
             return Y(self.Y.expr)
 
         return self
 
-    def smodel(self):
-        """Convert to s-domain"""
+    def _smodel_impl(self, memo):
 
+        key = id(self)
+        if key in memo:
+            return memo[key]
         if self.Isc == 0:
-            return Y(self.Y)
-        if self.Y == 0:
-            return sI(self.Isc)
-        return Par(sI(self.Isc), Y(self.Y))
+            result = Y(self.Y)
+        elif self.Y == 0:
+            result = sI(self.Isc)
+        else:
+            result = Par(sI(self.Isc), Y(self.Y))
+        memo[key] = result
+        return result
 
 
 class Thevenin(OnePort):
@@ -728,7 +1007,7 @@ class Thevenin(OnePort):
         +                       V1                -
     """
 
-    def __init__(self, Zval=Zs(0), Vval=Vs(0)):
+    def __init__(self, Zval=_ZS_ZERO, Vval=_VS_ZERO):
 
         # print('<T> Z:', Zval, 'V:', Vval)
         if not isinstance(Zval, Zs):
@@ -740,15 +1019,21 @@ class Thevenin(OnePort):
 
         super(Thevenin, self).__init__()
 
+    # As for Norton, cache the derived quantities.
+
     @property
     def Y(self):
-        return Ys(1 / self.Z)
+        if not hasattr(self, '_Ysc'):
+            self._Ysc = Ys(1 / self.Z)
+        return self._Ysc
 
     @property
     def Isc(self):
 
-        assumptions = self.Voc.assumptions
-        return Itype(self.Voc / self.Z, **assumptions)
+        if not hasattr(self, '_Isc'):
+            assumptions = self.Voc.assumptions
+            self._Isc = Itype(self.Voc / self.Z, **assumptions)
+        return self._Isc
 
     def parallel_ladder(self, *args):
         """Add unbalanced ladder network in parallel;
@@ -855,61 +1140,91 @@ class Thevenin(OnePort):
     def cpt(self):
         """Convert to a component, if possible"""
 
-        if self.Z.is_number and self.Voc == 0:
+        # As for Norton.cpt, form the s * products lazily; the common
+        # resistance case returns after a single comparison.
+        Voc_zero = self.Voc == 0
+
+        if self.Z.is_number and Voc_zero:
             return R(self.Z.expr)
 
-        v = s * self.Voc
-        if self.Z == 0 and v.is_number:
-            return Vdc(v.expr)
+        v = None
+        if self.Z == 0:
+            v = s * self.Voc
+            if v.is_number:
+                return Vdc(v.expr)
 
-        i = s * self.Isc
-        if self.Y == 0 and i.is_number:
-            return Idc(i.expr)
+        i = None
+        if self.Y == 0:
+            i = s * self.Isc
+            if i.is_number:
+                return Idc(i.expr)
 
-        y = s * self.Y
         z = s * self.Z
+        if z.is_number:
+            if v is None:
+                v = s * self.Voc
+            if v.is_number:
+                return C((1 / z).expr, v)
 
-        if z.is_number and v.is_number:
-            return C((1 / z).expr, v)
-
-        if y.is_number and i.is_number:
-            return L((1 / y).expr, i)
+        y = s * self.Y
+        if y.is_number:
+            if i is None:
+                i = s * self.Isc
+            if i.is_number:
+                return L((1 / y).expr, i)
 
-        if self.Voc == 0:
+        if Voc_zero:
             return Z(self.Z.expr)
 
         return self
 
-    def smodel(self):
-        """Convert to s-domain"""
+    def _smodel_impl(self, memo):
 
+        key = id(self)
+        if key in memo:
+            return memo[key]
         if self.Voc == 0:
-            return Z(self.Z)
-        if self.Z == 0:
-            return sV(self.Voc)
-        return Ser(sV(self.Voc), Z(self.Z))
+            result = Z(self.Z)
+        elif self.Z == 0:
+            result = sV(self.Voc)
+        else:
+            result = Ser(sV(self.Voc), Z(self.Z))
+        memo[key] = result
+        return result
 
 
 class R(Thevenin):
     """Resistor"""
 
+    _intern = True
+
     def __init__(self, Rval):
 
+        if self._initialized:
+            return
         self.args = (Rval, )
         Rval = cExpr(Rval, positive=True)
         super(R, self).__init__(Zs.R(Rval))
         self.R = Rval
+        self._is_zero = Rval == 0
+        self._initialized = True
 
 
 class G(Norton):
     """Conductance"""
 
+    _intern = True
+
     def __init__(self, Gval):
 
+        if self._initialized:
+            return
         self.args = (Gval, )
         Gval = cExpr(Gval, positive=True)
         super(G, self).__init__(Ys.G(Gval))
         self.G = Gval
+        self._is_zero = Gval == 0
+        self._initialized = True
 
     def net_make(self, net, n1=None, n2=None):
 
@@ -925,8 +1240,12 @@ class L(Thevenin):
 
     Inductance Lval, initial current i0"""
 
+    _intern = True
+
     def __init__(self, Lval, i0=None):
 
+        if self._initialized:
+            return
         self.hasic = i0 is not None
         if i0 is None:
             i0 = 0
@@ -941,8 +1260,9 @@ class L(Thevenin):
         super(L, self).__init__(Zs.L(Lval), -Vs(i0 * Lval))
         self.L = Lval
         self.i0 = i0
-       
-        self.zeroic = self.i0 == 0 
+
+        self.zeroic = self.i0 == 0
+        self._initialized = True
 
 
 class C(Thevenin):
@@ -950,8 +1270,12 @@ class C(Thevenin):
 
     Capacitance Cval, initial voltage v0"""
 
+    _intern = True
+
     def __init__(self, Cval, v0=None):
 
+        if self._initialized:
+            return
         self.hasic = v0 is not None
         if v0 is None:
             v0 = 0
@@ -968,26 +1292,39 @@ class C(Thevenin):
         self.v0 = v0
 
         self.zeroic = self.v0 == 0
+        self._initialized = True
 
 
 class Y(Norton):
     """General admittance."""
 
+    _intern = True
+
     def __init__(self, Yval):
 
+        if self._initialized:
+            return
         self.args = (Yval, )
         Yval = Ys(Yval)
         super(Y, self).__init__(Yval)
+        self._is_zero = Yval == 0
+        self._initialized = True
 
 
 class Z(Thevenin):
     """General impedance."""
 
+    _intern = True
+
     def __init__(self, Zval):
 
+        if self._initialized:
+            return
         self.args = (Zval, )
         Zval = Zs(Zval)
         super(Z, self).__init__(Zval)
+        self._is_zero = Zval == 0
+        self._initialized = True
 
 
 class VoltageSource(Thevenin):
@@ -997,7 +1334,20 @@ class VoltageSource(Thevenin):
 
     def __init__(self, Vval):
 
-        super(VoltageSource, self).__init__(Zs(0), Vs(Vval))
+        super(VoltageSource, self).__init__(_ZS_ZERO, Vs(Vval))
+
+    def compiled(self, *symbols):
+        """Return a numpy function of the given symbols evaluating the
+        s-domain voltage numerically.  The function is compiled with
+        sympy lambdify once per symbol tuple and cached on the
+        instance; intended for numeric parameter sweeps."""
+
+        if '_compiled' not in self.__dict__:
+            self._compiled = {}
+        if symbols not in self._compiled:
+            self._compiled[symbols] = sym.lambdify(symbols, self.Voc.expr,
+                                                   'numpy')
+        return self._compiled[symbols]
 
 
 class sV(VoltageSource):
@@ -1005,11 +1355,17 @@ class sV(VoltageSource):
 
     netkeyword = 's'
 
+    _intern = True
+
     def __init__(self, Vval):
 
+        if self._initialized:
+            return
         self.args = (Vval, )
         Vval = sExpr(Vval)
         super(sV, self).__init__(Vs(Vval))
+        self._is_zero = Vval == 0
+        self._initialized = True
 
     @property
     def Vocac(self):
@@ -1022,11 +1378,17 @@ class V(VoltageSource):
     voltage otherwise time domain.  A constant V is considered DC
     with an s-domain voltage V / s."""
 
+    _intern = True
+
     def __init__(self, Vval):
 
+        if self._initialized:
+            return
         self.args = (Vval, )
-        Vsym = tsExpr(Vval)
+        Vsym = _tsexpr(Vval)
         super(V, self).__init__(Vs(Vsym))
+        self._is_zero = Vsym == 0
+        self._initialized = True
 
     @property
     def Vocac(self):
@@ -1040,14 +1402,18 @@ class Vstep(VoltageSource):
 
     netkeyword = 'step'
 
+    _intern = True
+
     def __init__(self, v):
 
+        if self._initialized:
+            return
         self.args = (v, )
-        v = cExpr(v)
-        super(Vstep, self).__init__(Vs(v, causal=True) / s)
-        # This is not needed when assumptions propagated.
-        self.Voc.is_causal = True
+        v = _cexpr(v)
+        super(Vstep, self).__init__(Vs(v * _INV_S, causal=True))
         self.v0 = v
+        self._is_zero = v == 0
+        self._initialized = True
 
 
 class Vdc(VoltageSource):
@@ -1056,14 +1422,18 @@ class Vdc(VoltageSource):
 
     netkeyword = 'dc'
     
+    _intern = True
+
     def __init__(self, v):
 
+        if self._initialized:
+            return
         self.args = (v, )
-        v = cExpr(v)
-        super(Vdc, self).__init__(Vs(v, dc=True) / s)
-        # This is not needed when assumptions propagated.
-        self.Voc.is_dc = True
+        v = _cexpr(v)
+        super(Vdc, self).__init__(Vs(v * _INV_S, dc=True))
         self.v0 = v
+        self._is_zero = v == 0
+        self._initialized = True
 
     @property
     def voc(self):
@@ -1075,29 +1445,46 @@ class Vac(VoltageSource):
 
     netkeyword = 'ac'
 
+    _intern = True
+
     def __init__(self, V, phi=0):
 
+        if self._initialized:
+            return
         self.args = (V, phi)
-        V = cExpr(V)
-        phi = cExpr(phi)
-
-        # Note, cos(-pi / 2) is not quite zero.
+        V = _cexpr(V)
+        phi = _cexpr(phi)
 
-        self.omega = symbol('omega_1', real=True)
-        foo = (s * sym.cos(phi) + self.omega * sym.sin(phi)) / (s**2 + self.omega**2)
-        super(Vac, self).__init__(Vs(foo * V, ac=True))
-        # This is not needed when assumptions propagated.
-        self.Voc.is_ac = True
+        self.omega = _OMEGA_1
         self.v0 = V
         self.phi = phi
+        self._is_zero = V == 0
+        # Building the s-domain voltage is deferred until Voc is first
+        # accessed; voc and Vocac need only v0 and phi.
+        self.Z = _ZS_ZERO
+        super(Thevenin, self).__init__()
+        self._initialized = True
+
+    @property
+    def Voc(self):
+
+        if not hasattr(self, '_Voc'):
+            foo = _ac_kernel(self.omega, self.phi)
+            Voc = Vs(foo * self.v0, ac=True)
+            self._Voc = Voc
+        return self._Voc
 
 
     @property
     def voc(self):
+        if self.phi == 0:
+            return self.v0 * cos(self.omega * t)
         return self.v0 * cos(self.omega * t + self.phi)
 
     @property
     def Vocac(self):
+        if self.phi == 0:
+            return Vphasor(self.v0)
         return Vphasor(self.v0 * exp(j * self.phi))
 
 
@@ -1108,8 +1495,9 @@ class v(VoltageSource):
 
         self.args = (vval, )
         Vval = tExpr(vval)
-        super(V, self).__init__(Zs(0), Vs(Vval).laplace())
-        self.assumptions_infer(Vval)
+        # Propagate the dc/ac/causal assumptions inferred for the
+        # time-domain expression.
+        super(v, self).__init__(Vs(_laplace(Vval), **Vval.assumptions))
 
 
 class CurrentSource(Norton):
@@ -1119,7 +1507,18 @@ class CurrentSource(Norton):
 
     def __init__(self, Ival):
 
-        super(CurrentSource, self).__init__(Ys(0), Is(Ival))
+        super(CurrentSource, self).__init__(_YS_ZERO, Is(Ival))
+
+    def compiled(self, *symbols):
+        """Return a numpy function of the given symbols evaluating the
+        s-domain current numerically.  See VoltageSource.compiled."""
+
+        if '_compiled' not in self.__dict__:
+            self._compiled = {}
+        if symbols not in self._compiled:
+            self._compiled[symbols] = sym.lambdify(symbols, self.Isc.expr,
+                                                   'numpy')
+        return self._compiled[symbols]
 
 
 class sI(CurrentSource):
@@ -1127,11 +1526,17 @@ class sI(CurrentSource):
 
     netkeyword = 's'
 
+    _intern = True
+
     def __init__(self, Ival):
 
+        if self._initialized:
+            return
         self.args = (Ival, )
         Ival = sExpr(Ival)
-        super(sI, self).__init__(Ys(0), Is(Ival))
+        super(sI, self).__init__(_YS_ZERO, Is(Ival))
+        self._is_zero = Ival == 0
+        self._initialized = True
 
     @property
     def Iscac(self):
@@ -1147,11 +1552,17 @@ class I(CurrentSource):
 
     """
 
+    _intern = True
+
     def __init__(self, Ival):
 
+        if self._initialized:
+            return
         self.args = (Ival, )
-        Isym = tsExpr(Ival)
+        Isym = _tsexpr(Ival)
         super(I, self).__init__(Is(Isym))
+        self._is_zero = Isym == 0
+        self._initialized = True
 
     @property
     def Iocac(self):
@@ -1164,14 +1575,18 @@ class Istep(CurrentSource):
 
     netkeyword = 'step'
 
+    _intern = True
+
     def __init__(self, i):
 
+        if self._initialized:
+            return
         self.args = (i, )
-        i = cExpr(i)
-        super(Istep, self).__init__(Is(i, causal=True) / s)
-        # This is not needed when assumptions propagated.
-        self.Isc.is_causal = True
+        i = _cexpr(i)
+        super(Istep, self).__init__(Is(i * _INV_S, causal=True))
         self.i0 = i
+        self._is_zero = i == 0
+        self._initialized = True
 
 
 class Idc(CurrentSource):
@@ -1180,14 +1595,18 @@ class Idc(CurrentSource):
 
     netkeyword = 'dc'
     
+    _intern = True
+
     def __init__(self, i):
 
+        if self._initialized:
+            return
         self.args = (i, )
-        i = cExpr(i)
-        super(Idc, self).__init__(Is(i, dc=True) / s)
-        # This is not needed when assumptions propagated.
-        self.Isc.is_dc = True
+        i = _cexpr(i)
+        super(Idc, self).__init__(Is(i * _INV_S, dc=True))
         self.i0 = i
+        self._is_zero = i == 0
+        self._initialized = True
 
     @property
     def isc(self):
@@ -1203,26 +1622,45 @@ class Iac(CurrentSource):
 
     netkeyword = 'ac'
 
+    _intern = True
+
     def __init__(self, I, phi=0):
 
+        if self._initialized:
+            return
         self.args = (I, phi)
-        I = cExpr(I)
-        phi = cExpr(phi)
-
-        self.omega = symbol('omega_1', real=True)
-        foo = (s * sym.cos(phi) + self.omega * sym.sin(phi)) / (s**2 + self.omega**2)
-        super(Iac, self).__init__(Is(foo * I, ac=True))
-        # This is not needed when assumptions propagated.
-        self.Isc.is_ac = True
+        I = _cexpr(I)
+        phi = _cexpr(phi)
+
+        self.omega = _OMEGA_1
         self.i0 = I
         self.phi = phi
+        self._is_zero = I == 0
+        # Building the s-domain current is deferred until Isc is first
+        # accessed; isc and Iscac need only i0 and phi.
+        self.Y = _YS_ZERO
+        super(Norton, self).__init__()
+        self._initialized = True
+
+    @property
+    def Isc(self):
+
+        if not hasattr(self, '_Isc'):
+            foo = _ac_kernel(self.omega, self.phi)
+            Isc = Is(foo * self.i0, ac=True)
+            self._Isc = Isc
+        return self._Isc
 
     @property
     def isc(self):
+        if self.phi == 0:
+            return self.i0 * cos(self.omega * t)
         return self.i0 * cos(self.omega * t + self.phi)
 
     @property
     def Iscac(self):
+        if self.phi == 0:
+            return Iphasor(self.i0)
         return Iphasor(self.i0 * exp(j * self.phi))
 
 
@@ -1233,8 +1671,115 @@ class i(CurrentSource):
 
         self.args = (ival, )
         Ival = tExpr(ival)
-        super(I, self).__init__(Is(Ival.laplace()))
-        self.assumptions_infer(Ival)
+        # Propagate the dc/ac/causal assumptions inferred for the
+        # time-domain expression.
+        super(i, self).__init__(Is(_laplace(Ival), **Ival.assumptions))
+
+
+def _fold(vals):
+
+    total = vals[0]
+    for val in vals[1:]:
+        total = total + val
+    return total
+
+
+def _fold_reciprocal(vals):
+
+    total = 1 / vals[0]
+    for val in vals[1:]:
+        total = total + 1 / val
+    return 1 / total
+
+
+def _combine_L_ser(args):
+    # The currents should be the same!
+    for arg in args[1:]:
+        if arg.i0 != args[0].i0:
+            raise ValueError('Series inductors with different'
+                             ' initial currents!')
+    return L(_fold([arg.L for arg in args]), args[0].i0)
+
+
+def _combine_C_par(args):
+    # The voltages should be the same!
+    for arg in args[1:]:
+        if arg.v0 != args[0].v0:
+            raise ValueError('Parallel capacitors with different'
+                             ' initial voltages!')
+    return C(_fold([arg.C for arg in args]), args[0].v0)
+
+
+def _combine_Vac(args):
+    # Can only combine ac sources with the same phase.
+    for arg in args[1:]:
+        if arg.phi != args[0].phi:
+            return None
+    return Vac(_fold([arg.v0 for arg in args]), args[0].args[1])
+
+
+def _combine_Iac(args):
+    # Can only combine ac sources with the same phase.
+    for arg in args[1:]:
+        if arg.phi != args[0].phi:
+            return None
+    return Iac(_fold([arg.i0 for arg in args]), args[0].args[1])
+
+
+# Combiner dispatch tables used by ParSer._combine_many, keyed on the
+# exact component class.  Classes with no entry cannot be combined for
+# that connection.
+_ser_combiners = {
+    R: lambda args: R(_fold([arg.R for arg in args])),
+    G: lambda args: G(_fold_reciprocal([arg.G for arg in args])),
+    L: _combine_L_ser,
+    C: lambda args: C(_fold_reciprocal([arg.C for arg in args]),
+                      _fold([arg.v0 for arg in args])),
+    V: lambda args: V(_fold([tsExpr(arg.args[0]) for arg in args])),
+    Vdc: lambda args: Vdc(_fold([arg.v0 for arg in args])),
+    Vstep: lambda args: Vstep(_fold([arg.v0 for arg in args])),
+    Vac: _combine_Vac,
+}
+
+_par_combiners = {
+    R: lambda args: R(_fold_reciprocal([arg.R for arg in args])),
+    G: lambda args: G(_fold([arg.G for arg in args])),
+    L: lambda args: L(_fold_reciprocal([arg.L for arg in args]),
+                      _fold([arg.i0 for arg in args])),
+    C: _combine_C_par,
+    I: lambda args: I(_fold([tsExpr(arg.args[0]) for arg in args])),
+    Idc: lambda args: Idc(_fold([arg.i0 for arg in args])),
+    Istep: lambda args: Istep(_fold([arg.i0 for arg in args])),
+    Iac: _combine_Iac,
+}
+
+
+# Identity component predicates used by ParSer._combine and
+# ParSer.simplify.  singledispatch gives C-level type dispatch; the
+# default returns False for anything unregistered.
+
+@singledispatch
+def _is_identity_ser(arg):
+    """True if arg contributes nothing to a series connection."""
+    return False
+
+
+@_is_identity_ser.register(V)
+@_is_identity_ser.register(Z)
+def _(arg):
+    return arg._is_zero
+
+
+@singledispatch
+def _is_identity_par(arg):
+    """True if arg contributes nothing to a parallel connection."""
+    return False
+
+
+@_is_identity_par.register(I)
+@_is_identity_par.register(Y)
+def _(arg):
+    return arg._is_zero
 
 
 class Xtal(Thevenin):
@@ -1247,18 +1792,30 @@ class Xtal(Thevenin):
 
     def __init__(self, C0, R1, L1, C1):
 
-        self.C0 = cExpr(C0, positive=True)
-        self.R1 = cExpr(R1, positive=True)
-        self.L1 = cExpr(L1, positive=True)
-        self.C1 = cExpr(C1, positive=True)
+        self.C0 = _cexpr(C0, positive=True)
+        self.R1 = _cexpr(R1, positive=True)
+        self.L1 = _cexpr(L1, positive=True)
+        self.C1 = _cexpr(C1, positive=True)
+
+        # Use the closed-form Butterworth van Dyke impedance rather
+        # than solving the expanded network with MNA.
+        Zm = self.R1 + s * self.L1 + 1 / (s * self.C1)
+        Z = Zs((Zm / (s * self.C0 * Zm + 1)).expr.cancel())
 
-        N = self.expand()
-        super(Xtal, self).__init__(N.Z, N.V)
+        super(Xtal, self).__init__(Z, _VS_ZERO)
         self.args = (C0, R1, L1, C1)
 
-    def expand(self):
+    def _expand_impl(self, memo):
 
-        return (R(self.R1) + L(self.L1) + C(self.C1)) | C(self.C0)
+        # The model depends only on the args so the expanded network
+        # is cached on the instance.  Probe __dict__ directly since
+        # expand() is first called from __init__ before the Netlist
+        # attributes that __getattr__ relies on exist.
+        if '_expanded' not in self.__dict__:
+            self._expanded = ((R(self.R1) + L(self.L1) + C(self.C1)) |
+                              C(self.C0))
+        memo[id(self)] = self._expanded
+        return self._expanded
 
 
 class FerriteBead(Thevenin):
@@ -1270,18 +1827,27 @@ class FerriteBead(Thevenin):
 
     def __init__(self, Rs, Rp, Cp, Lp):
 
-        self.Rs = cExpr(Rs, positive=True)
-        self.Rp = cExpr(Rp, positive=True)
-        self.Cp = cExpr(Cp, positive=True)
-        self.Lp = cExpr(Lp, positive=True)
+        self.Rs = _cexpr(Rs, positive=True)
+        self.Rp = _cexpr(Rp, positive=True)
+        self.Cp = _cexpr(Cp, positive=True)
+        self.Lp = _cexpr(Lp, positive=True)
+
+        # The impedance of the series network has a simple closed form
+        # so there is no need to solve the expanded network with MNA.
+        Z = Zs((self.Rs + self.Rp + s * self.Lp +
+                1 / (s * self.Cp)).expr.cancel())
 
-        N = self.expand()
-        super(Xtal, self).__init__(N.Z, N.V)
+        super(FerriteBead, self).__init__(Z, _VS_ZERO)
         self.args = (Rs, Rp, Cp, Lp)
 
-    def expand(self):
+    def _expand_impl(self, memo):
 
-        return R(self.Rs) + (R(self.Rp) + L(self.Lp) + C(self.Cp))
+        # As for Xtal, the expanded network is cached on the instance.
+        if '_expanded' not in self.__dict__:
+            self._expanded = R(self.Rs) + (R(self.Rp) + L(self.Lp) +
+                                           C(self.Cp))
+        memo[id(self)] = self._expanded
+        return self._expanded
 
 
 # Import this at end to circumvent circular dependencies
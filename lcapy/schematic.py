@@ -158,6 +158,9 @@ class Cnodes(dict):
 
 class Gedge(object):
 
+    __slots__ = ('cpt', 'from_gnode', 'to_gnode', 'size', 'stretch',
+                 'stretched')
+
     def __init__(self, cpt, from_gnode, to_gnode, size, stretch=False):
 
         self.cpt = cpt
@@ -182,6 +185,11 @@ class Gedge(object):
 
 class Gnode(object):
 
+    # path and fixed are assigned lazily by Graph.analyse; leaving
+    # them unset is significant since Graph.dot tests with hasattr.
+    __slots__ = ('name', 'prev', 'next', 'dist', 'pos', 'fedges',
+                 'redges', 'path', 'fixed')
+
     def __init__(self, name):
 
         self.name = name
@@ -233,14 +241,14 @@ class Graph(dict):
 
     def __repr__(self):
 
-        s = ''
+        lines = []
         for gnode in self.values():
             if gnode.fedges == []:
-                s += '@%s %s\n' % (gnode.dist, gnode.fmt_name)
+                lines.append('@%s %s\n' % (gnode.dist, gnode.fmt_name))
             else:
                 for edge in gnode.fedges:
-                    s += '@%s %s\n' % (gnode.dist, edge)
-        return s
+                    lines.append('@%s %s\n' % (gnode.dist, edge))
+        return ''.join(lines)
 
     def __getitem__(self, key):
 
@@ -301,7 +309,9 @@ class Graph(dict):
         if 'start' in self:
             return
 
-        gnodes = self.values()
+        # Snapshot the gnodes since add_node mutates the dict and
+        # Python 3 views cannot be iterated during mutation.
+        gnodes = list(self.values())
         start = self.add_node('start')
         end = self.add_node('end')
 
@@ -388,7 +398,6 @@ class Graph(dict):
             # Have dangling node, so no stretch needed.
             gnode.pos = from_gnode.pos + from_dist
             return True
-            unknown.discard(n)
 
         separation = to_gnode.pos - from_gnode.pos
         extent = to_dist + from_dist
@@ -487,6 +496,11 @@ class Graph(dict):
     def longest_path_to_known(self, start, forward=True):
         """Find longest path through DAG to a node with a known dist."""
 
+        # Memoize the distances so that each gnode is traversed once;
+        # otherwise the search is exponential when the graph has
+        # diamonds.
+        memo = {}
+
         def traverse(gnode):
 
             if gnode.name in ('start', 'end'):
@@ -498,16 +512,19 @@ class Graph(dict):
                 gnode.next = None
                 return gnode.pos
 
+            if gnode.name in memo:
+                return memo[gnode.name]
+
             edges = gnode.fedges if forward else gnode.redges
             min_dist = 2000
             for edge in edges:
                 next_gnode = edge.to_gnode
-                # TODO, memoize
                 dist = traverse(next_gnode) - edge.size
                 if dist < min_dist:
                     min_dist = dist
                     next_gnode.prev = edge
                     gnode.next = edge
+            memo[gnode.name] = min_dist
             return min_dist
 
         start.dist = 0
@@ -594,8 +611,8 @@ class Graph(dict):
         if stage != 0:
             self.analyse(stage=stage)
 
-        dotfile = open (filename, 'w')
-        dotfile.write ('strict digraph {\n\tgraph [rankdir=LR];\n')
+        # Buffer the graph description and write it in one go.
+        parts = ['strict digraph {\n\tgraph [rankdir=LR];\n']
 
         for gnode in self.values():
             if hasattr(gnode, 'fixed'):
@@ -609,17 +626,19 @@ class Graph(dict):
             if pos < 1e-6:
                 pos = 0
 
-            dotfile.write ('\t"%s"\t [style=filled, color=%s, xlabel="@%s"];\n' % (gnode.fmt_name, colour, fmt_dec(pos)))
+            parts.append('\t"%s"\t [style=filled, color=%s, xlabel="@%s"];\n' % (gnode.fmt_name, colour, fmt_dec(pos)))
 
         for gnode in self.values():
             for edge in gnode.fedges:
                 colour = 'black' if edge.stretch else 'red'
-                dotfile.write ('\t"%s" ->\t"%s" [ color=%s, label="%s%s" ];\n' % (
-                    gnode.fmt_name, edge.to_gnode.fmt_name, colour, 
+                parts.append('\t"%s" ->\t"%s" [ color=%s, label="%s%s" ];\n' % (
+                    gnode.fmt_name, edge.to_gnode.fmt_name, colour,
                     fmt_dec(edge.size), '*' if edge.stretch else ''))
 
-        dotfile.write ('}\n')
-        dotfile.close ()
+        parts.append('}\n')
+
+        with open(filename, 'w') as dotfile:
+            dotfile.write(''.join(parts))
 
 
 class Node(object):
@@ -682,7 +701,7 @@ class Node(object):
         if draw_nodes == 'connections':
             return self.count > 2
 
-        return '_' not in self.name
+        return self.primary
 
     @property
     def port(self):
@@ -738,7 +757,7 @@ class Schematic(NetfileMixin):
     def netlist(self):
         """Return the current netlist"""
 
-        return '\n'.join([elt.__str__() for elt in self.elements.values()])
+        return '\n'.join(str(elt) for elt in self.elements.values())
 
     def _invalidate(self):
 
@@ -748,19 +767,23 @@ class Schematic(NetfileMixin):
 
     def _node_add(self, node, elt):
 
-        if node not in self.nodes:
-            self.nodes[node] = Node(node)
-        self.nodes[node].append(elt)
+        nodeobj = self.nodes.get(node)
+        newnode = nodeobj is None
+        if newnode:
+            nodeobj = self.nodes[node] = Node(node)
+        nodeobj.append(elt)
 
-        vnode = self.nodes[node].rootname
+        vnode = nodeobj.rootname
 
         if elt.type in ('U', 'MX', 'S', 'SP', 'TP', 'TR'):
-            self.nodes[node].pin = True
+            nodeobj.pin = True
 
         if vnode not in self.snodes:
             self.snodes[vnode] = []
 
-        if node not in self.snodes[vnode]:
+        # A node is only added to its snode list the first time it is
+        # seen, so there is no need to scan the list.
+        if newnode:
             self.snodes[vnode].append(node)
 
     def _cpt_add(self, cpt):
@@ -862,16 +885,18 @@ class Schematic(NetfileMixin):
         self.xgraph = Graph('horizontal', self.nodes)
         self.ygraph = Graph('vertical', self.nodes)
 
+        elts = list(self.elements.values())
+
         # Use components in orthogonal directions as constraints.  The
         # nodes of orthogonal components get combined into a
         # common node.
-        for m, elt in enumerate(self.elements.values()):
+        for elt in elts:
             elt.xlink(self.xgraph)
             elt.ylink(self.ygraph)
 
         # Now form forward and reverse directed graph using components
         # in the desired directions.
-        for m, elt in enumerate(self.elements.values()):
+        for elt in elts:
             elt.xplace(self.xgraph)
             elt.yplace(self.ygraph)
 
@@ -910,7 +935,7 @@ class Schematic(NetfileMixin):
 
         snode_dir = self.snodes
 
-        for m, snode_list in enumerate(snode_dir.values()):
+        for snode_list in snode_dir.values():
             wires.extend(self._make_wires1(snode_list))
 
         return wires
@@ -923,7 +948,7 @@ class Schematic(NetfileMixin):
         if not label_nodes:
             return s
 
-        for m, node in enumerate(self.nodes.values()):
+        for node in self.nodes.values():
 
             name = node.name
             name = name.split('.')[-1]
@@ -956,33 +981,36 @@ class Schematic(NetfileMixin):
         # Note, scale does not scale the font size.
         opts = r'scale=%.2f,transform shape,/tikz/circuitikz/bipoles/length=%.2fcm,%s' % (
             self.scale, self.cpt_size, style_args)
-        s = r'\begin{tikzpicture}[%s]''\n' % opts
+
+        # Accumulate the picture in a list and join once at the end;
+        # building it with += is quadratic in the schematic size.
+        parts = [r'\begin{tikzpicture}[%s]''\n' % opts]
 
         help = float(kwargs.pop('help_lines', 0))
         if help != 0:
             start = Pos(-0.5, -0.5) * self.node_spacing
             stop = Pos(self.width + 0.5, self.height + 0.5) * self.node_spacing
 
-            s += r'\draw[help lines, blue] (%s) grid [xstep=%s, ystep=%s] (%s);''\n' % (
-                start, help, help, stop)
+            parts.append(r'\draw[help lines, blue] (%s) grid [xstep=%s, ystep=%s] (%s);''\n' % (
+                start, help, help, stop))
 
         # Write coordinates
         for n in self.nodes.values():
-            s += r'  \coordinate (%s) at (%s);''\n' % (n.s, n.pos)
+            parts.append(r'  \coordinate (%s) at (%s);''\n' % (n.s, n.pos))
 
         # Draw components
-        for m, elt in enumerate(self.elements.values()):
-            s += elt.draw(**kwargs)
+        for elt in self.elements.values():
+            parts.append(elt.draw(**kwargs))
 
         wires = self._make_wires()
 
-        s += self._label_nodes(**kwargs)
+        parts.append(self._label_nodes(**kwargs))
 
-        s += '  ' + kwargs.pop('append', '')
+        parts.append('  ' + kwargs.pop('append', ''))
 
-        s += r'\end{tikzpicture}''\n'
+        parts.append(r'\end{tikzpicture}''\n')
 
-        return s
+        return ''.join(parts)
 
     def tikz_draw(self, filename, **kwargs):
 
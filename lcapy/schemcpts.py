@@ -49,11 +49,6 @@ class Cpt(object):
     default_width = 1.0
     default_aspect = 1.0
 
-    @property
-    def s(self):
-        """Sanitised name"""
-        return self.name.replace('.', '@')
-
     def __init__(self, sch, name, cpt_type, cpt_id, string,
                  opts_string, nodes, *args):
 
@@ -61,6 +56,8 @@ class Cpt(object):
         self.type = cpt_type
         self.id = cpt_id
         self.name = name
+        # Sanitised name
+        self.s = name.replace('.', '@')
 
         self.net = string.split(';')[0]
         self.opts_string = opts_string
@@ -162,22 +159,22 @@ class Cpt(object):
     def stretch(self):
         return self.can_stretch and not self.fixed
 
+    # Rotation angle for each orientation option; the insertion order
+    # fixes the precedence when several options are given.
+    angle_dict = {'right': 0, 'down': -90, 'left': 180, 'up': 90}
+
     @property
     def angle(self):
         """Return rotation angle"""
-        if self.right:
-            angle = 0   
-        elif self.down:
-            angle = -90
-        elif self.left:
-            angle = 180
-        elif self.up:
-            angle = 90
+        opts = self.opts
+        for key, angle in self.angle_dict.items():
+            if key in opts:
+                break
         else:
             angle = -90 if self.type in ('O', 'P') else 0
-        
-        if 'rotate' in self.opts:
-            angle += float(self.opts['rotate'])
+
+        if 'rotate' in opts:
+            angle += float(opts['rotate'])
         return angle
 
     @property
@@ -194,21 +191,26 @@ class Cpt(object):
     def aspect(self):
         return float(self.opts.get('aspect', self.default_aspect))
 
+    # Pre-seed the cache with exact matrices for the cardinal angles;
+    # computing these with trig introduces rounding errors.
+    _Rdict = {0: np.array(((1, 0), (0, 1))),
+              90: np.array(((0, 1), (-1, 0))),
+              180: np.array(((-1, 0), (0, -1))),
+              -180: np.array(((-1, 0), (0, -1))),
+              -90: np.array(((0, -1), (1, 0)))}
+
     def R(self, angle_offset=0):
         """Return rotation matrix"""
         angle = self.angle + angle_offset
-        
-        Rdict = {0: ((1, 0), (0, 1)),
-                 90: ((0, 1), (-1, 0)),
-                 180: ((-1, 0), (0, -1)),
-                 -180: ((-1, 0), (0, -1)),
-                 -90: ((0, -1), (1, 0))}
-        if angle in Rdict:
-            return np.array(Rdict[angle])
-        
-        t = angle / 180.0 * np.pi
-        return np.array(((np.cos(t), np.sin(t)),
-                         (-np.sin(t), np.cos(t))))
+
+        # Few distinct angles occur in practice so cache the rotation
+        # matrices rather than recomputing the trig each call.
+        Rdict = Cpt._Rdict
+        if angle not in Rdict:
+            t = angle / 180.0 * np.pi
+            Rdict[angle] = np.array(((np.cos(t), np.sin(t)),
+                                     (-np.sin(t), np.cos(t))))
+        return Rdict[angle]
 
     @property
     def vnodes(self):
@@ -240,9 +242,9 @@ class Cpt(object):
     def scoords(self):
         """Scaled coordinates for each of the nodes"""
 
-        c = np.array(self.coords)
-        S = np.array(((self.w, self.h),) * c.shape[0])
-        return c * S
+        # Broadcast the scale factors over the rows rather than tiling
+        # them into a temporary array.
+        return np.array(self.coords) * (self.w, self.h)
 
     @property
     def tcoords(self):
@@ -261,33 +263,34 @@ class Cpt(object):
     def yvals(self):
         return self.tcoords[:, 1]
 
-    def xlink(self, graphs):
+    def _link(self, graphs, vals):
 
-        xvals = self.xvals
-        for m1, n1 in enumerate(self.dvnodes):
-            for m2, n2 in enumerate(self.dvnodes[m1 + 1:], m1 + 1):
-                if xvals[m2] == xvals[m1]:
-                    graphs.link(n1.name, n2.name)
+        dvnodes = self.dvnodes
+        for m1, n1 in enumerate(dvnodes):
+            val1 = vals[m1]
+            for m2 in range(m1 + 1, len(dvnodes)):
+                if vals[m2] == val1:
+                    graphs.link(n1.name, dvnodes[m2].name)
 
-    def ylink(self, graphs):
+    def xlink(self, graphs):
+        self._link(graphs, self.xvals)
 
-        yvals = self.yvals
-        for m1, n1 in enumerate(self.dvnodes):
-            for m2, n2 in enumerate(self.dvnodes[m1 + 1:], m1 + 1):
-                if yvals[m2] == yvals[m1]:
-                    graphs.link(n1.name, n2.name)
+    def ylink(self, graphs):
+        self._link(graphs, self.yvals)
 
     def place(self, graphs, vals):
-        
+
         size = self.size
+        stretch = self.stretch
+        dvnodes = self.dvnodes
         idx = np.argsort(vals)[::-1]
         for i in range(len(idx) - 1):
             m1 = idx[i]
             m2 = idx[i + 1]
-            n1 = self.dvnodes[m1]
-            n2 = self.dvnodes[m2]
+            n1 = dvnodes[m1]
+            n2 = dvnodes[m2]
             value = (vals[m2] - vals[m1]) * size
-            graphs.add(self, n1.name, n2.name, value, self.stretch)
+            graphs.add(self, n1.name, n2.name, value, stretch)
 
     def xplace(self, graphs):
         self.place(graphs, self.xvals)
@@ -2,6 +2,8 @@ import numpy as np
 
 class Pos(object):
 
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y=0):
 
         if isinstance(x, tuple):
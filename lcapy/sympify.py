@@ -19,6 +19,8 @@ cpt_name_pattern = re.compile(r"(%s)([\w']*)" % '|'.join(cpt_names))
 
 sub_super_pattern = re.compile(r"([_\^]){([\w]+)}")
 
+identifier_pattern = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
 def canonical_name(name):
 
     def foo(match):
@@ -78,6 +80,19 @@ def parse(string, symbols={}, evaluate=True, local_dict={}, **assumptions):
 
     cache = assumptions.pop('cache', True)
 
+    # Symbol names such as 'R1' are commonly parsed and need neither
+    # the tokenizer nor the expression parser.
+    if (identifier_pattern.match(string) and string != 'j'
+            and string not in global_dict):
+        name = canonical_name(string)
+        if name in local_dict:
+            s = local_dict[name]
+        else:
+            s = Symbol(name, **assumptions)
+        if cache and name not in symbols:
+            symbols[name] = s
+        return s
+
     def auto_symbol(tokens, local_dict, global_dict):
         """Inserts calls to ``Symbol`` for undefined variables."""
         result = []
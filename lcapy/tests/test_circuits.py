@@ -12,15 +12,19 @@ class LcapyTester(unittest.TestCase):
 
     def assertEqual2(self, ans1, ans2, comment):
 
-        ans1 = ans1.canonical()
-        ans2 = ans2.canonical()
+        diff = ans1.expr - ans2.expr
 
-        try:
-            self.assertEqual(ans1, ans2, comment)
-        except AssertionError as e:
+        # Comparisons against zero and of structurally identical
+        # expressions need no canonicalisation.  Otherwise simplify
+        # the difference; this canonicalises both sides in a single
+        # SymPy pass.
+        if diff != 0:
+            diff = sym.simplify(sym.expand(diff))
+
+        if diff != 0:
             ans1.pprint()
             ans2.pprint()
-            raise AssertionError(e)
+            raise AssertionError(comment)
 
     def test_RC1(self):
         """Lcapy: check RC network
@@ -50,17 +54,17 @@ class LcapyTester(unittest.TestCase):
         a.add('R1 1 2')
         a.add('C1 2 0')
 
+        # Share the reference network so its impedance is only solved
+        # for once.
+        b = R('R1') | C('C1')
+
         # Note, V1 acts as a short-circuit for the impedance/admittance
-        self.assertEqual2(
-            a.Z(1, 2), (R('R1') | C('C1')).Z, "Z incorrect across R1")
-        self.assertEqual2(
-            a.Z(2, 0), (R('R1') | C('C1')).Z, "Z incorrect across C1")
+        self.assertEqual2(a.Z(1, 2), b.Z, "Z incorrect across R1")
+        self.assertEqual2(a.Z(2, 0), b.Z, "Z incorrect across C1")
         self.assertEqual2(a.Z(1, 0), R(0).Z, "Z incorrect across V1")
 
-        self.assertEqual2(
-            a.Y(1, 2), (R('R1') | C('C1')).Y, "Y incorrect across R1")
-        self.assertEqual2(
-            a.Y(2, 0), (R('R1') | C('C1')).Y, "Y incorrect across C1")
+        self.assertEqual2(a.Y(1, 2), b.Y, "Y incorrect across R1")
+        self.assertEqual2(a.Y(2, 0), b.Y, "Y incorrect across C1")
         # This has a non-invertible A matrix.
         # self.assertEqual2(a.Y(1, 0), R(0).Y, "Y incorrect across V1")
 
@@ -91,16 +95,16 @@ class LcapyTester(unittest.TestCase):
             a.norton(1, 2).I.sc, a.Isc(1, 2), "incorrect norton current")
         self.assertEqual2(
             a.norton(1, 2).Y, a.Y(1, 2), "incorrect norton admittance")
-        self.assertEqual2(
-            a.Z(1, 2), (R('R1') | L('L1')).Z, "Z incorrect across R1")
-        self.assertEqual2(
-            a.Z(2, 0), (R('R1') | L('L1')).Z, "Z incorrect across L1")
+        # Share the reference network so its impedance is only solved
+        # for once.
+        b = R('R1') | L('L1')
+
+        self.assertEqual2(a.Z(1, 2), b.Z, "Z incorrect across R1")
+        self.assertEqual2(a.Z(2, 0), b.Z, "Z incorrect across L1")
         self.assertEqual2(a.Z(1, 0), R(0).Z, "Z incorrect across V1")
 
-        self.assertEqual2(
-            a.Y(1, 2), (R('R1') | L('L1')).Y, "Y incorrect across R1")
-        self.assertEqual2(
-            a.Y(2, 0), (R('R1') | L('L1')).Y, "Y incorrect across L1")
+        self.assertEqual2(a.Y(1, 2), b.Y, "Y incorrect across R1")
+        self.assertEqual2(a.Y(2, 0), b.Y, "Y incorrect across L1")
         # This has a non-invertible A matrix.
         # self.assertEqual2(a.Y(1, 0), R(0).Y, "Y incorrect across V1")
 
@@ -12,15 +12,19 @@ class LcapyTester(unittest.TestCase):
 
     def assertEqual2(self, ans1, ans2, comment):
 
-        ans1 = ans1.canonical()
-        ans2 = ans2.canonical()
+        diff = ans1.expr - ans2.expr
 
-        try:
-            self.assertEqual(ans1, ans2, comment)
-        except AssertionError as e:
+        # Comparisons against zero and of structurally identical
+        # expressions need no canonicalisation.  Otherwise simplify
+        # the difference; this canonicalises both sides in a single
+        # SymPy pass.
+        if diff != 0:
+            diff = sym.simplify(sym.expand(diff))
+
+        if diff != 0:
             ans1.pprint()
             ans2.pprint()
-            raise AssertionError(e)
+            raise AssertionError(comment)
 
     def test_VR_ac1(self):
         """Lcapy: check VR ac network
@@ -1,5 +1,8 @@
 from lcapy import *
+from lcapy.core import Zs
+from lcapy.twoport import AMatrix
 import unittest
+import numpy as np
 import sympy as sym
 
 
@@ -294,6 +297,51 @@ class LcapyTester(unittest.TestCase):
         self.assertEqual(b.Z, 10, "incorrect Z.")
         self.assertEqual(b.Voc, 5 / s, "incorrect V.")
 
+    def test_AMatrix_sections(self):
+        """Lcapys: check AMatrix section constructors against the
+        chained forms
+
+        """
+        Z1 = Zs('Z1')
+        Z2 = Zs('Z2')
+        Z3 = Zs('Z3')
+
+        checks = (
+            (AMatrix.Lsection(Z1, Z2),
+             AMatrix.Zseries(Z1).chain(AMatrix.Zshunt(Z2))),
+            (AMatrix.Tsection(Z1, Z2, Z3),
+             AMatrix.Zseries(Z1).chain(AMatrix.Zshunt(Z2)).chain(
+                 AMatrix.Zseries(Z3))),
+            (AMatrix.Pisection(Z1, Z2, Z3),
+             AMatrix.Zshunt(Z1).chain(AMatrix.Zseries(Z2)).chain(
+                 AMatrix.Zshunt(Z3))))
+
+        for a, b in checks:
+            for m in range(2):
+                for n in range(2):
+                    self.assertEqual(sym.simplify(a[m, n] - b[m, n]), 0,
+                                     "section A matrix incorrect.")
+
+    def test_frequency_response(self):
+        """Lcapys: check frequency_response returns arrays along the
+        frequency vector even for frequency-independent entries
+
+        """
+        fvector = [1.0, 10.0, 100.0]
+
+        a = LSection(R(100), R(50))
+        results = a.frequency_response(fvector)
+        entries = (a.B.B11, a.B.B12, a.B.B21, a.B.B22, a.V2b, a.I2b)
+        for result, entry in zip(results, entries):
+            self.assertEqual(result.shape, (3, ), "incorrect shape.")
+            for value in result:
+                self.assertEqual(value, complex(entry.expr),
+                                 "incorrect value.")
+
+        b = LSection(R(100), C(1e-6))
+        for result in b.frequency_response(fvector):
+            self.assertEqual(result.shape, (3, ), "incorrect shape.")
+
     def test_LSection_models(self):
         """Lcapys: check LSection models
 
@@ -6,7 +6,9 @@ Copyright 2014, 2015, 2016 Michael Hayes, UCECE
 
 from __future__ import division
 from warnings import warn
+import numpy as np
 import sympy as sym
+from sympy.utilities.lambdify import lambdify
 from lcapy.core import s, Vs, Is, Zs, Ys, Hs, cExpr, sExpr
 from lcapy.core import WyeDelta, DeltaWye, Vector, Matrix
 from lcapy.core import VsVector, IsVector, YsVector, ZsVector
@@ -96,171 +98,311 @@ __all__ = ('Chain', 'Par2', 'Ser2', 'Hybrid2', 'InverseHybrid2', 'Series',
            'LSection', 'Ladder', 'GeneralTxLine', 'LosslessTxLine', 'TxLine')
 
 
+# Shared zero-source sentinels; the models never mutate their sources
+# so a single instance of each suffices.
+_VS_ZERO = Vs(0)
+_IS_ZERO = Is(0)
+
+
+def _pop_checked(kwargs):
+    """Pop the private _checked flag, raising on any other keyword so
+    a typo cannot silently bypass or be ignored."""
+
+    checked = kwargs.pop('_checked', False)
+    if kwargs:
+        raise TypeError('Unexpected keyword arguments %s' %
+                        ', '.join(sorted(kwargs)))
+    return checked
+
+
 def _check_oneport_args(args):
 
+    if all(isinstance(arg1, OnePort) for arg1 in args):
+        return
     for arg1 in args:
         if not isinstance(arg1, OnePort):
             raise ValueError('%s not a OnePort' % arg1)
 
 
-class TwoPortMatrix(Matrix):
+def _cached_property(func):
+    """Property that caches its value on the instance.  The two-port
+    matrices are never mutated once constructed so the conversions
+    between representations can be computed once and reused."""
+
+    name = func.__name__
+
+    def wrapper(self):
+        try:
+            cache = self._conv_cache
+        except AttributeError:
+            cache = self._conv_cache = {}
+        try:
+            return cache[name]
+        except KeyError:
+            value = func(self)
+            cache[name] = value
+            return value
+
+    return property(wrapper, doc=func.__doc__)
+
+
+def _fold_ladder(elements):
+    """Fold a list of (series, OP) primitives into the B matrix and
+    source pair of the resulting two-port.  A series element only
+    updates the second column of the B matrix and a shunt element only
+    the first, so the fold is O(N) scalar operations and the matrix is
+    only materialised once at the end."""
+
+    series, OP = elements[-1]
+    if series:
+        b11, b12, b21, b22 = 1, -OP.Z, 0, 1
+        v, i = OP.Voc, 0
+    else:
+        b11, b12, b21, b22 = 1, 0, -OP.Y, 1
+        v, i = 0, OP.Isc
+
+    for series, OP in reversed(elements[:-1]):
+        if series:
+            Voc = OP.Voc
+            v = v + b11 * Voc
+            i = i + b21 * Voc
+            Z = OP.Z
+            b12 = b12 - b11 * Z
+            b22 = b22 - b21 * Z
+        else:
+            Isc = OP.Isc
+            v = v + b12 * Isc
+            i = i + b22 * Isc
+            Y = OP.Y
+            b11 = b11 - b12 * Y
+            b21 = b21 - b22 * Y
 
-    def __new__(cls, *args):
+    return BMatrix(b11, b12, b21, b22), Vs(v), Is(i)
+
+
+def _memoize_factory(func):
+    """Cache the matrices built by an element factory classmethod,
+    keyed by the argument values and types.  Identical elements are
+    constructed repeatedly when building sections so the symbolic
+    matrix construction is only paid once per distinct value."""
+
+    cache = {}
 
-        args = [sym.simplify(arg) for arg in args]
+    def wrapper(cls, *args, **kwargs):
+        try:
+            key = (cls, tuple((type(arg), arg) for arg in args),
+                   tuple(sorted(kwargs.items())))
+            return cache[key]
+        except TypeError:
+            # Unhashable argument; fall back to direct construction.
+            return func(cls, *args, **kwargs)
+        except KeyError:
+            result = cache[key] = func(cls, *args, **kwargs)
+            return result
 
-        if len(args) == 4:
-            return super(TwoPortMatrix, cls).__new__(
-                cls, ((args[0], args[1]), (args[2], args[3])))
+    return classmethod(wrapper)
+
+
+def _mul2x2(cls, M, N):
+    """Hand-coded 2 x 2 matrix product returning an instance of `cls`;
+    sympy's generic matrix multiplication is much slower for symbolic
+    entries."""
 
-        return super(TwoPortMatrix, cls).__new__(cls, *args)
+    return cls(M[0, 0] * N[0, 0] + M[0, 1] * N[1, 0],
+               M[0, 0] * N[0, 1] + M[0, 1] * N[1, 1],
+               M[1, 0] * N[0, 0] + M[1, 1] * N[1, 0],
+               M[1, 0] * N[0, 1] + M[1, 1] * N[1, 1])
 
-    # The following properties are fallbacks when other conversions have
-    # not been defined.
 
-    @property
-    def A(self):
-        return AMatrix(self.B.inv())
+def _inv2x2(M):
+    """Return the entries of the inverse of a 2 x 2 matrix computed
+    from the adjugate; sympy's general inverse performs Gaussian
+    elimination which is far slower for symbolic entries."""
 
-    @property
-    def B(self):
-        return BMatrix(self.A.inv())
+    inv = 1 / (M[0, 0] * M[1, 1] - M[0, 1] * M[1, 0])
+    return (M[1, 1] * inv, -M[0, 1] * inv, -M[1, 0] * inv, M[0, 0] * inv)
 
-    @property
-    def G(self):
-        return GMatrix(self.H.inv())
 
-    @property
-    def H(self):
-        return HMatrix(self.G.inv())
+def _tidy(arg):
+    """Tidy up a matrix entry.  The conversions produce ratios of
+    rational functions so cancel suffices and is much cheaper than
+    simplify.  Numbers are passed through untouched."""
 
-    @property
-    def Y(self):
-        return YMatrix(self.Z.inv())
+    if hasattr(arg, 'expr'):
+        arg = arg.expr
+    if isinstance(arg, (int, float, complex)):
+        return arg
+    if getattr(arg, 'is_Atom', False) or getattr(arg, 'is_number', False):
+        return arg
+    if hasattr(arg, 'applyfunc'):
+        return arg.applyfunc(sym.cancel)
+    return sym.cancel(arg)
 
-    @property
-    def Z(self):
-        return ZMatrix(self.Y.inv())
 
-    @property
-    def A11(self):
-        """Open-circuit inverse voltage ratio"""
-        return self.A[0, 0]
+def _expr(arg):
+    """Return the underlying sympy expression of an lcapy value."""
 
-    @property
-    def A12(self):
-        """Negative short-circuit transfer impedance"""
-        return self.A[0, 1]
+    return arg.expr if hasattr(arg, 'expr') else sym.sympify(arg)
 
-    @property
-    def A21(self):
-        """Negative short-circuit inverse current ratio"""
-        return self.A[1, 0]
 
-    @property
-    def A22(self):
-        """Open circuit transfer admittance"""
-        return self.A[1, 1]
+def _is_zero(arg):
+    """Fast zero test for a matrix entry; the Integer singleton
+    short-circuits the structural sympy comparison."""
 
-    @property
-    def B11(self):
-        """Open-circuit voltage gain"""
-        return self.B[0, 0]
+    if hasattr(arg, 'expr'):
+        arg = arg.expr
+    return arg is sym.S.Zero or arg == 0
 
-    @property
-    def B12(self):
-        """Negative short-circuit transfer impedance"""
-        return self.B[0, 1]
 
-    @property
-    def B21(self):
-        """Negative short-circuit current gain"""
-        return self.B[1, 0]
+def _is_one(arg):
+    """Fast unity test for a matrix entry; the Integer singleton
+    short-circuits the structural sympy comparison."""
 
-    @property
-    def B22(self):
-        """Open-circuit transfer admittance"""
-        return self.B[1, 1]
+    if hasattr(arg, 'expr'):
+        arg = arg.expr
+    return arg is sym.S.One or arg == 1
 
-    @property
-    def G11(self):
-        """Open-circuit input admittance"""
-        return self.G[0, 0]
 
-    @property
-    def G12(self):
-        """Short-circuit reverse current gain"""
-        return self.G[0, 1]
+def _stack22(entries):
+    """Stack four numeric entries into 2 x 2 matrices in the trailing
+    dimensions of the result."""
 
-    @property
-    def G21(self):
-        """Open-circuit forward voltage gain"""
-        return self.G[1, 0]
+    entries = [np.asarray(entry, dtype=complex) for entry in entries]
+    A11, A12, A21, A22 = np.broadcast_arrays(*entries)
+    return np.stack((np.stack((A11, A12), axis=-1),
+                     np.stack((A21, A22), axis=-1)), axis=-2)
 
-    @property
-    def G22(self):
-        """Short-circuit output impedance"""
-        return self.G[1, 1]
 
-    @property
-    def H11(self):
-        """Short-circuit input impedance"""
-        return self.H[0, 0]
+def twoport_numeric(M, symbols):
+    """Return a function that numerically evaluates the entries of the
+    two-port matrix `M` for the specified symbols.  The returned
+    function accepts scalars or numpy arrays (for sweeping component
+    values) and returns an array with the 2 x 2 matrices in the
+    trailing dimensions.  This is much faster than substituting
+    values into the symbolic entries one at a time."""
 
-    @property
-    def H12(self):
-        """Open-circuit reverse voltage gain"""
-        return self.H[0, 1]
+    entries = [M[0, 0], M[0, 1], M[1, 0], M[1, 1]]
+    entries = [entry.expr if hasattr(entry, 'expr') else entry
+               for entry in entries]
+    func = lambdify(symbols, entries, modules='numpy')
 
-    @property
-    def H21(self):
-        """Short-circuit forward current gain"""
-        return self.H[1, 0]
+    def evaluate(*args):
 
-    @property
-    def H22(self):
-        """Open-circuit output admittance"""
-        return self.H[1, 1]
+        return _stack22(func(*args))
 
-    @property
-    def Y11(self):
-        """Short-circuit input admittance"""
-        return self.Y[0, 0]
+    return evaluate
 
-    @property
-    def Y12(self):
-        """Short-circuit reverse transfer admittance"""
-        return self.Y[0, 1]
 
-    @property
-    def Y21(self):
-        """Short-circuit transfer admittance"""
-        return self.Y[1, 0]
+# Map matrix entry names such as 'A12' to the corresponding conversion
+# matrix attribute and entry indices.  A single __getattr__ consulting
+# this table replaces the 24 near-identical properties that
+# TwoPortMatrix and TwoPort each used to define.
+_matrix_entries = {}
+for _name in 'ABGHYZ':
+    for _row in (1, 2):
+        for _col in (1, 2):
+            _matrix_entries['%s%d%d' % (_name, _row, _col)] = (
+                _name, _row - 1, _col - 1)
 
-    @property
-    def Y22(self):
-        """Short-circuit output admittance"""
-        return self.Y[1, 1]
 
-    @property
-    def Z11(self):
-        """Open-cicuit input impedance"""
-        return self.Z[0, 0]
+class TwoPortMatrix(Matrix):
 
-    @property
-    def Z12(self):
-        """Open-cicuit transfer impedance"""
-        return self.Z[0, 1]
+    def __new__(cls, *args):
 
-    @property
-    def Z21(self):
-        """Open-cicuit reverse transfer impedance"""
-        return self.Z[1, 0]
+        args = [_tidy(arg) for arg in args]
 
-    @property
-    def Z22(self):
-        """Open-cicuit output impedance"""
-        return self.Z[1, 1]
+        if len(args) == 4:
+            return super(TwoPortMatrix, cls).__new__(
+                cls, ((args[0], args[1]), (args[2], args[3])))
+
+        return super(TwoPortMatrix, cls).__new__(cls, *args)
+
+    @classmethod
+    def _trusted(cls, entries):
+        """Build a 2 x 2 matrix from four already sympified entries,
+        bypassing the per-entry tidy and sympify of the normal
+        constructor."""
+
+        return cls._new(2, 2, list(entries))
+
+    @_cached_property
+    def _det(self):
+        """Determinant, expanded for the 2 x 2 case and cached since
+        several conversions need it."""
+
+        return self[0, 0] * self[1, 1] - self[0, 1] * self[1, 0]
+
+    def evaluate(self, params):
+        """Numerically evaluate the matrix entries using the dictionary
+        of symbol values `params`.  The values may be numpy arrays to
+        sweep component values; the 2 x 2 matrices are returned in the
+        trailing dimensions of the result."""
+
+        func = twoport_numeric(self, tuple(params))
+        return func(*params.values())
+
+    def numeric_chain(self, others, params):
+        """Chain this matrix with a sequence of other two-port matrices,
+        evaluating each with the dictionary of symbol values `params`.
+        The symbolic chain builds and tidies a new symbolic matrix per
+        product; reducing the chain with numerical 2 x 2 products
+        avoids that when only numbers are wanted."""
+
+        result = self.evaluate(params)
+        for M in others:
+            result = np.matmul(result, M.evaluate(params))
+        return result
+
+    # The following properties are fallbacks when other conversions have
+    # not been defined.
+
+    @_cached_property
+    def A(self):
+        return AMatrix(*_inv2x2(self.B))
+
+    @_cached_property
+    def B(self):
+        return BMatrix(*_inv2x2(self.A))
+
+    @_cached_property
+    def G(self):
+        return GMatrix(*_inv2x2(self.H))
+
+    @_cached_property
+    def H(self):
+        return HMatrix(*_inv2x2(self.G))
+
+    @_cached_property
+    def Y(self):
+        return YMatrix(*_inv2x2(self.Z))
+
+    @_cached_property
+    def Z(self):
+        return ZMatrix(*_inv2x2(self.Y))
+
+    def __getattr__(self, name):
+        """Return an entry of one of the conversion matrices, e.g., A12
+        is entry [0, 1] of the A matrix."""
+
+        try:
+            attr, row, col = _matrix_entries[name]
+        except KeyError:
+            raise AttributeError(name)
+        return getattr(self, attr)[row, col]
+
+    # The short-circuit admittances only need single entries of the Y
+    # matrix so the subclasses provide closed forms that avoid
+    # materialising it.
+
+    @_cached_property
+    def Y1sc(self):
+        """Input admittance with the output port short circuit"""
+        return self.Y[0, 0]
+
+    @_cached_property
+    def Y2sc(self):
+        """Output admittance with the input port short circuit"""
+        return self.Y[1, 1]
 
 
 class AMatrix(TwoPortMatrix):
@@ -287,43 +429,47 @@ class AMatrix(TwoPortMatrix):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_cached_property
     def B(self):
 
         # Inverse
-        det = self.det()
+        det = self._det
         if det == 0:
             warn('Producing dodgy B matrix')
-        return BMatrix(self.A22 / det, -self.A12 / det,
-                       -self.A21 / det, self.A11 / det)
+        inv = 1 / det
+        return BMatrix(self.A22 * inv, -self.A12 * inv,
+                       -self.A21 * inv, self.A11 * inv)
 
-    @property
+    @_cached_property
     def H(self):
 
         if self.A22 == 0:
             warn('Producing dodgy H matrix')
-        return HMatrix(self.A12 / self.A22, self.det() / self.A22,
-                       -1 / self.A22, self.A21 / self.A22)
+        inv = 1 / self.A22
+        return HMatrix(self.A12 * inv, self._det * inv,
+                       -inv, self.A21 * inv)
 
-    @property
+    @_cached_property
     def Y(self):
 
         # This produces a bogus Y matrix when A12 is zero (say for a
         # shunt element).   Note, it doesn't use A21.
         if self.A12 == 0:
             warn('Producing dodgy Y matrix')
-        return YMatrix(self.A22 / self.A12, -self.det() / self.A12,
-                       -1 / self.A12, self.A11 / self.A12)
+        inv = 1 / self.A12
+        return YMatrix(self.A22 * inv, -self._det * inv,
+                       -inv, self.A11 * inv)
 
-    @property
+    @_cached_property
     def Z(self):
 
         # This produces a bogus Z matrix when A21 is zero (say for a
         # series element).   Note, it doesn't use A12.
         if self.A21 == 0:
             warn('Producing dodgy Z matrix')
-        return ZMatrix(self.A11 / self.A21, self.det() / self.A21,
-                       1 / self.A21, self.A22 / self.A21)
+        inv = 1 / self.A21
+        return ZMatrix(self.A11 * inv, self._det * inv,
+                       inv, self.A22 * inv)
 
     @property
     def Z1oc(self):
@@ -380,21 +526,40 @@ class AMatrix(TwoPortMatrix):
     @classmethod
     def Lsection(cls, Z1, Z2):
 
-        return cls.Zseries(Z1).chain(cls.Zshunt(Z2))
+        # Closed form of Zseries(Z1).chain(Zshunt(Z2)).
+        Y = 1 / Z2
+        return cls(1 + Z1 * Y, Z1, Y, 1)
 
     @classmethod
     def Tsection(cls, Z1, Z2, Z3):
 
-        return cls.Lsection(Z1, Z2).chain(cls.Zseries(Z3))
+        # Closed form of Lsection(Z1, Z2).chain(Zseries(Z3)).
+        Y = 1 / Z2
+        A11 = 1 + Z1 * Y
+        return cls(A11, A11 * Z3 + Z1, Y, 1 + Z3 * Y)
 
     @classmethod
     def Pisection(cls, Z1, Z2, Z3):
 
-        return cls.Zshunt(Z1).chain(cls.Lsection(Z2, Z3))
+        # Closed form of Zshunt(Z1).chain(Lsection(Z2, Z3)).
+        Y1 = 1 / Z1
+        Y3 = 1 / Z3
+        A11 = 1 + Z2 * Y3
+        return cls(A11, Z2, Y1 * A11 + Y3, 1 + Y1 * Z2)
+
+    @_cached_property
+    def Y1sc(self):
+        """Input admittance with the output port short circuit"""
+        return self[1, 1] / self[0, 1]
+
+    @_cached_property
+    def Y2sc(self):
+        """Output admittance with the input port short circuit"""
+        return self[0, 0] / self[0, 1]
 
     def chain(self, OP):
 
-        return self * OP
+        return _mul2x2(AMatrix, self, OP)
 
     def cascade(self, OP):
 
@@ -418,41 +583,55 @@ class BMatrix(TwoPortMatrix):
     B = inv(A)
     """
 
-    @property
+    @_cached_property
     def A(self):
         # Inverse
-        det = self.det()
+        inv = 1 / self._det
         return AMatrix(
-            self.B22 / det, -self.B12 / det, -self.B21 / det, self.B11 / det)
+            self.B22 * inv, -self.B12 * inv, -self.B21 * inv, self.B11 * inv)
 
     @property
     def B(self):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_cached_property
     def G(self):
 
-        return GMatrix(-self.B21 / self.B22, -1 / self.B22,
-                       self.det() / self.B22, -self.B12 / self.B22)
+        inv = 1 / self.B22
+        return GMatrix(-self.B21 * inv, -inv,
+                       self._det * inv, -self.B12 * inv)
 
-    @property
+    @_cached_property
     def H(self):
 
-        return HMatrix(-self.B12 / self.B11, 1 / self.B11, -
-                       self.det() / self.B11, -self.B21 / self.B11)
+        inv = 1 / self.B11
+        return HMatrix(-self.B12 * inv, inv,
+                       -self._det * inv, -self.B21 * inv)
 
-    @property
+    @_cached_property
     def Y(self):
 
-        return YMatrix(-self.B11 / self.B12, 1 / self.B12,
-                       self.det() / self.B12, -self.B22 / self.B12)
+        inv = 1 / self.B12
+        return YMatrix(-self.B11 * inv, inv,
+                       self._det * inv, -self.B22 * inv)
 
-    @property
+    @_cached_property
+    def Y1sc(self):
+        """Input admittance with the output port short circuit"""
+        return -self[0, 0] / self[0, 1]
+
+    @_cached_property
+    def Y2sc(self):
+        """Output admittance with the input port short circuit"""
+        return -self[1, 1] / self[0, 1]
+
+    @_cached_property
     def Z(self):
 
-        return ZMatrix(-self.B22 / self.B21, -1 / self.B21, -
-                       self.det() / self.B21, -self.B11 / self.B21)
+        inv = 1 / self.B21
+        return ZMatrix(-self.B22 * inv, -inv,
+                       -self._det * inv, -self.B11 * inv)
 
     @property
     def Z1oc(self):
@@ -460,7 +639,7 @@ class BMatrix(TwoPortMatrix):
         # Z11
         return Zs(-self.B22 / self.B21)
 
-    @classmethod
+    @_memoize_factory
     def Zseries(cls, Zval):
 
         if not isinstance(Zval, Zs):
@@ -468,7 +647,7 @@ class BMatrix(TwoPortMatrix):
 
         return cls(1, -Zval, 0, 1)
 
-    @classmethod
+    @_memoize_factory
     def Yseries(cls, Yval):
 
         if not isinstance(Yval, Ys):
@@ -476,7 +655,7 @@ class BMatrix(TwoPortMatrix):
 
         return cls(1, -1 / Yval, 0, 1)
 
-    @classmethod
+    @_memoize_factory
     def Yshunt(cls, Yval):
 
         if not isinstance(Yval, Ys):
@@ -484,7 +663,7 @@ class BMatrix(TwoPortMatrix):
 
         return cls(1, 0, -Yval, 1)
 
-    @classmethod
+    @_memoize_factory
     def Zshunt(cls, Zval):
 
         if not isinstance(Zval, Zs):
@@ -492,7 +671,7 @@ class BMatrix(TwoPortMatrix):
 
         return cls(1, 0, -1 / Zval, 1)
 
-    @classmethod
+    @_memoize_factory
     def voltage_amplifier(cls, Af, Ar=1e-9, Yin=1e-9, Zout=1e-9):
         """Voltage amplifier
         Af forward voltage gain
@@ -534,7 +713,7 @@ class BMatrix(TwoPortMatrix):
         return cls(1 / Ar, -1 / (Ar * Yin), -1 / (Ar * Zout), -
                    1 / (Ar * Yin * Zout * (Af * Ar - 1)))
 
-    @classmethod
+    @_memoize_factory
     def current_amplifier(cls, Af, Ar=1e-9, Zin=1e-9, Yout=1e-9):
         """Current amplifier
         Af forward current gain
@@ -573,34 +752,34 @@ class BMatrix(TwoPortMatrix):
         return cls(1 / Ar, -1 / (Ar * Yout), -1 / (Ar * Zin), -
                    1 / (Ar * Yout * Zin * (Af * Ar - 1)))
 
-    @classmethod
+    @_memoize_factory
     def voltage_differentiator(cls, Av=1):
 
         return cls.voltage_amplifier(sExpr(Av).differentiate())
 
-    @classmethod
+    @_memoize_factory
     def voltage_integrator(cls, Av):
 
         return cls.voltage_amplifier(sExpr(Av).integrate())
 
-    @classmethod
+    @_memoize_factory
     def current_differentiator(cls, Av):
 
         return cls.current_amplifier(sExpr(Av).differentiate())
 
-    @classmethod
+    @_memoize_factory
     def current_integrator(cls, Av):
 
         return cls.current_amplifier(sExpr(Av).integrate())
 
-    @classmethod
+    @_memoize_factory
     def transformer(cls, alpha):
 
         alpha = cExpr(alpha)
 
         return cls(alpha, 0, 0, 1 / alpha)
 
-    @classmethod
+    @_memoize_factory
     def gyrator(cls, R):
 
         R = cExpr(R)
@@ -629,7 +808,7 @@ class BMatrix(TwoPortMatrix):
     def chain(self, TP):
 
         # Note reverse order compared to AMatrix.
-        return TP * self
+        return _mul2x2(BMatrix, TP, self)
 
     def cascade(self, TP):
 
@@ -654,32 +833,34 @@ class GMatrix(TwoPortMatrix):
     G = inv(H)
     """
 
-    @property
+    @_cached_property
     def A(self):
         # return self.H.A
-        return AMatrix(1 / self.G21, self.G22 / self.G21,
-                       self.G11 / self.G21, self.det() / self.G21)
+        inv = 1 / self.G21
+        return AMatrix(inv, self.G22 * inv,
+                       self.G11 * inv, self._det * inv)
 
-    @property
+    @_cached_property
     def B(self):
         # return self.H.B
-        return BMatrix(-self.det() / self.G12, self.G22 /
-                       self.G12, self.G11 / self.G12, -1 / self.G12)
+        inv = 1 / self.G12
+        return BMatrix(-self._det * inv, self.G22 * inv,
+                       self.G11 * inv, -inv)
 
     @property
     def G(self):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_cached_property
     def H(self):
-        return HMatrix(self.inv())
+        return HMatrix(*_inv2x2(self))
 
-    @property
+    @_cached_property
     def Y(self):
         return self.H.Y
 
-    @property
+    @_cached_property
     def Z(self):
         return self.H.Z
 
@@ -701,30 +882,34 @@ class HMatrix(TwoPortMatrix):
     H = inv(G)
     """
 
-    @property
+    @_cached_property
     def A(self):
-        return AMatrix(-self.det() / self.H21, -self.H11 /
-                       self.H21, -self.H22 / self.H21, -1 / self.H21)
+        inv = 1 / self.H21
+        return AMatrix(-self._det * inv, -self.H11 * inv,
+                       -self.H22 * inv, -inv)
 
-    @property
+    @_cached_property
     def B(self):
-        return BMatrix(1 / self.H12, -self.H11 / self.H12, -
-                       self.H22 / self.H12, self.det() / self.H12)
+        inv = 1 / self.H12
+        return BMatrix(inv, -self.H11 * inv,
+                       -self.H22 * inv, self._det * inv)
 
     @property
     def H(self):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_cached_property
     def Y(self):
-        return YMatrix(1 / self.H11, -self.H12 / self.H11,
-                       self.H21 / self.H11, self.det() / self.H11)
+        inv = 1 / self.H11
+        return YMatrix(inv, -self.H12 * inv,
+                       self.H21 * inv, self._det * inv)
 
-    @property
+    @_cached_property
     def Z(self):
-        return ZMatrix(self.det() / self.H22, self.H12 / self.H22,
-                       -self.H21 / self.H22, 1 / self.H22)
+        inv = 1 / self.H22
+        return ZMatrix(self._det * inv, self.H12 * inv,
+                       -self.H21 * inv, inv)
 
 
 class YMatrix(TwoPortMatrix):
@@ -745,35 +930,48 @@ class YMatrix(TwoPortMatrix):
     """
 
     @property
-    def Ysc(self):
-        return YsVector(self.Y11, self.Y22)
+    def Y1sc(self):
+        """Input admittance with the output port short circuit"""
+        return self[0, 0]
 
     @property
-    def A(self):
-        return AMatrix(-self.Y22 / self.Y21, -1 / self.Y21, -
-                       self.det() / self.Y21, -self.Y11 / self.Y21)
+    def Y2sc(self):
+        """Output admittance with the input port short circuit"""
+        return self[1, 1]
 
     @property
+    def Ysc(self):
+        return YsVector(self.Y1sc, self.Y2sc)
+
+    @_cached_property
+    def A(self):
+        inv = 1 / self.Y21
+        return AMatrix(-self.Y22 * inv, -inv,
+                       -self._det * inv, -self.Y11 * inv)
+
+    @_cached_property
     def B(self):
-        return BMatrix(-self.Y11 / self.Y12, 1 / self.Y12,
-                       self.det() / self.Y12, -self.Y22 / self.Y12)
+        inv = 1 / self.Y12
+        return BMatrix(-self.Y11 * inv, inv,
+                       self._det * inv, -self.Y22 * inv)
 
-    @property
+    @_cached_property
     def H(self):
-        return HMatrix(1 / self.Y11, -self.Y12 / self.Y11,
-                       self.Y21 / self.Y11, self.det() / self.Y11)
+        inv = 1 / self.Y11
+        return HMatrix(inv, -self.Y12 * inv,
+                       self.Y21 * inv, self._det * inv)
 
     @property
     def Y(self):
         # Perhaps we should make a copy?
         return self
 
-    @property
+    @_cached_property
     def Z(self):
         # Inverse
-        det = self.det()
+        inv = 1 / self._det
         return ZMatrix(
-            self.Y22 / det, -self.Y12 / det, -self.Y21 / det, self.Y11 / det)
+            self.Y22 * inv, -self.Y12 * inv, -self.Y21 * inv, self.Y11 * inv)
 
 
 class ZMatrix(TwoPortMatrix):
@@ -797,27 +995,40 @@ class ZMatrix(TwoPortMatrix):
     def Zoc(self):
         return ZsVector(self.Z11, self.Z22)
 
-    @property
+    @_cached_property
+    def Y1sc(self):
+        """Input admittance with the output port short circuit"""
+        return self[1, 1] / self._det
+
+    @_cached_property
+    def Y2sc(self):
+        """Output admittance with the input port short circuit"""
+        return self[0, 0] / self._det
+
+    @_cached_property
     def A(self):
-        return AMatrix(self.Z11 / self.Z21, self.det() / self.Z21,
-                       1 / self.Z21, self.Z22 / self.Z21)
+        inv = 1 / self.Z21
+        return AMatrix(self.Z11 * inv, self._det * inv,
+                       inv, self.Z22 * inv)
 
-    @property
+    @_cached_property
     def B(self):
-        return BMatrix(self.Z22 / self.Z12, -self.det() /
-                       self.Z12, -1 / self.Z12, self.Z11 / self.Z12)
+        inv = 1 / self.Z12
+        return BMatrix(self.Z22 * inv, -self._det * inv,
+                       -inv, self.Z11 * inv)
 
-    @property
+    @_cached_property
     def H(self):
-        return HMatrix(self.det() / self.Z22, self.Z12 / self.Z22,
-                       -self.Z21 / self.Z22, 1 / self.Z22)
+        inv = 1 / self.Z22
+        return HMatrix(self._det * inv, self.Z12 * inv,
+                       -self.Z21 * inv, inv)
 
-    @property
+    @_cached_property
     def Y(self):
         # Inverse
-        det = self.det()
+        inv = 1 / self._det
         return YMatrix(
-            self.Z22 / det, -self.Z12 / det, -self.Z21 / det, self.Z11 / det)
+            self.Z22 * inv, -self.Z12 * inv, -self.Z21 * inv, self.Z11 * inv)
 
     @property
     def Z(self):
@@ -859,208 +1070,256 @@ class TwoPort(Network):
     def _check_twoport_args(self):
 
         # This is an interim measure until Par2, Ser2, etc. generalised.
+        # Only the direct children are checked; each child validated its
+        # own arguments when it was constructed.
         if len(self.args) != 2:
             raise ValueError('Only two args supported for %s' %
                              self.__class__.__name__)
+        if all(isinstance(arg1, TwoPort) for arg1 in self.args):
+            return
         for arg1 in self.args:
             if not isinstance(arg1, TwoPort):
                 raise ValueError('%s not a TwoPort' % arg1)
 
-    @property
-    def A11(self):
-        return self.A[0, 0]
-
-    @property
-    def A12(self):
-        return self.A[0, 1]
-
-    @property
-    def A21(self):
-        return self.A[1, 0]
-
-    @property
-    def A22(self):
-        return self.A[1, 1]
-
-    @property
-    def B11(self):
-        return self.B[0, 0]
+    def __getattr__(self, name):
+        """Return an entry of one of the conversion matrices, e.g., A12
+        is entry [0, 1] of the A matrix.  Other names fall through to
+        the netlist element lookup."""
 
-    @property
-    def B12(self):
-        return self.B[0, 1]
+        try:
+            attr, row, col = _matrix_entries[name]
+        except KeyError:
+            return super(TwoPort, self).__getattr__(name)
+        return getattr(self, attr)[row, col]
 
-    @property
-    def B21(self):
-        return self.B[1, 0]
-
-    @property
-    def B22(self):
-        return self.B[1, 1]
-
-    @property
-    def G11(self):
-        return self.G[0, 0]
-
-    @property
-    def G12(self):
-        return self.G[0, 1]
-
-    @property
-    def G21(self):
-        return self.G[1, 0]
-
-    @property
-    def G22(self):
-        return self.G[1, 1]
-
-    @property
-    def H11(self):
-        return self.H[0, 0]
-
-    @property
-    def H12(self):
-        return self.H[0, 1]
-
-    @property
-    def H21(self):
-        return self.H[1, 0]
-
-    @property
-    def H22(self):
-        return self.H[1, 1]
-
-    @property
-    def Y11(self):
-        return self.Y[0, 0]
-
-    @property
-    def Y12(self):
-        return self.Y[0, 1]
-
-    @property
-    def Y21(self):
-        return self.Y[1, 0]
-
-    @property
-    def Y22(self):
-        return self.Y[1, 1]
-
-    @property
-    def Z11(self):
-        return self.Z[0, 0]
-
-    @property
-    def Z12(self):
-        return self.Z[0, 1]
-
-    @property
-    def Z21(self):
-        return self.Z[1, 0]
-
-    @property
-    def Z22(self):
-        return self.Z[1, 1]
+    # The predicates read the B matrix once; each entry accessed
+    # through B11 etc. would fetch the matrix anew.
 
     @property
     def isbuffered(self):
         """Return true if two-port is buffered, i.e., any load
         on the output has no affect on the input. """
         # return self.A12 == 0 and self.A22 == 0
-        return self.B12 == 0 and self.B22 == 0
+        B = self.B
+        return _is_zero(B[0, 1]) and _is_zero(B[1, 1])
 
     @property
     def isbilateral(self):
         """Return true if two-port is bilateral. """
-        return self.B.det() == 1
+        return _is_one(self.B._det)
 
     @property
     def issymmetrical(self):
         """Return true if two-port is symmetrical. """
-        return self.B11 == self.B22
+        B = self.B
+        return B[0, 0] == B[1, 1]
 
     @property
     def isseries(self):
         """Return true if two-port is a series network. """
         # return (self.A11 == 1) and (self.A22 == 1) and (self.A21 == 0)
-        return (self.B11 == 1) and (self.B22 == 1) and (self.B21 == 0)
+        B = self.B
+        return _is_one(B[0, 0]) and _is_one(B[1, 1]) and _is_zero(B[1, 0])
 
     @property
     def isshunt(self):
         """Return true if two-port is a shunt network. """
         # return (self.A11 == 1) and (self.A22 == 1) and (self.A12 == 0)
-        return (self.B11 == 1) and (self.B22 == 1) and (self.B12 == 0)
+        B = self.B
+        return _is_one(B[0, 0]) and _is_one(B[1, 1]) and _is_zero(B[0, 1])
 
-    @property
+    @_cached_property
     def A(self):
         """Return chain matrix"""
         return self._M.A
 
-    @property
+    def lambdify_chain(self, symbols=()):
+        """Return a function that numerically evaluates the four B
+        matrix entries and the V2b and I2b sources for the specified
+        symbols plus the Laplace variable (passed last).  The compiled
+        function is cached on the instance; numeric sweeps then bypass
+        sympy substitution entirely."""
+
+        try:
+            cache = self._compiled_chain
+        except AttributeError:
+            cache = self._compiled_chain = {}
+        key = tuple(str(symbol) for symbol in symbols)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        B = self.B
+        exprs = [_expr(arg) for arg in
+                 (B[0, 0], B[0, 1], B[1, 0], B[1, 1], self.V2b, self.I2b)]
+        func = lambdify(tuple(symbols) + (s.expr, ), exprs, modules='numpy')
+        cache[key] = func
+        return func
+
+    def frequency_response(self, fvector, params=None):
+        """Evaluate the B matrix entries and sources along the
+        frequency vector `fvector` (Hz), substituting the symbol values
+        in the dictionary `params`.  Returns the tuple (B11, B12, B21,
+        B22, V2b, I2b) of numpy arrays."""
+
+        if params is None:
+            params = {}
+        func = self.lambdify_chain(tuple(params))
+        svals = 2j * np.pi * np.asarray(fvector)
+        # Broadcast against svals as well; a frequency-independent
+        # entry comes back from lambdify as a scalar.
+        return tuple(np.broadcast_to(np.asarray(result, dtype=complex),
+                                     svals.shape)
+                     for result in func(*(list(params.values()) + [svals])))
+
+    def transfer_function_array(self, expr, svector):
+        """Evaluate the transfer function `expr` at the vector of
+        Laplace-variable values `svector` (e.g., j * 2 * pi * f).  The
+        expression is lambdified with the numpy backend and the
+        compiled function is cached on the instance, so repeated
+        sweeps of the same quantity only pay for the array
+        evaluation."""
+
+        expr = _expr(expr)
+        try:
+            cache = self._compiled_tf
+        except AttributeError:
+            cache = self._compiled_tf = {}
+        try:
+            func = cache[expr]
+        except KeyError:
+            func = cache[expr] = lambdify((s.expr, ), expr, modules='numpy')
+
+        svector = np.asarray(svector)
+        return np.broadcast_to(np.asarray(func(svector), dtype=complex),
+                               svector.shape)
+
+    def Ytrans12_array(self, svector):
+        """Evaluate the forward transadmittance Ytrans12 at the vector
+        of Laplace-variable values `svector`."""
+
+        return self.transfer_function_array(self.Ytrans12, svector)
+
+    def Ztrans12_array(self, svector):
+        """Evaluate the forward transimpedance Ztrans12 at the vector
+        of Laplace-variable values `svector`."""
+
+        return self.transfer_function_array(self.Ztrans12(), svector)
+
+    def compile(self, symbols):
+        """Return a function that numerically evaluates the A matrix
+        for the specified symbols.  The chain matrix is computed
+        symbolically once, its four entries are factored with common
+        subexpression elimination and lambdified, and the compiled
+        function is cached on the instance, so parameter sweeps do not
+        rebuild the symbolic chain."""
+
+        try:
+            cache = self._compiled
+        except AttributeError:
+            cache = self._compiled = {}
+        key = tuple(str(symbol) for symbol in symbols)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        A = self.A
+        entries = [A[0, 0], A[0, 1], A[1, 0], A[1, 1]]
+        entries = [entry.expr if hasattr(entry, 'expr') else entry
+                   for entry in entries]
+        replacements, reduced = sym.cse(entries)
+
+        args = list(symbols)
+        steps = []
+        for lhs, rhs in replacements:
+            steps.append(lambdify(args, rhs, modules='numpy'))
+            args.append(lhs)
+        final = lambdify(args, reduced, modules='numpy')
+
+        def func(*args):
+
+            values = list(args)
+            for step in steps:
+                values.append(step(*values))
+            return _stack22(final(*values))
+
+        cache[key] = func
+        return func
+
+    @_cached_property
     def B(self):
         """Return inverse chain matrix"""
         return self._M.B
 
-    @property
+    @_cached_property
     def G(self):
         """Return inverse hybrid matrix"""
         return self._M.G
 
-    @property
+    @_cached_property
     def H(self):
         """Return hybrid matrix"""
         return self._M.H
 
-    @property
+    @_cached_property
     def Y(self):
         """Return admittance matrix"""
         return self._M.Y
 
-    @property
+    @_cached_property
     def Z(self):
         """Return impedance matrix"""
         return self._M.Z
 
-    @property
+    # A two-port is immutable once constructed so the derived sources
+    # are cached; they are re-read for every stage when folding chains.
+
+    @_cached_property
     def I1a(self):
-        return Is(-self.V2b / self.B12)
+        return Is(-self.V2b / self.B[0, 1])
 
-    @property
+    @_cached_property
     def V1a(self):
         # CHECKME
-        return Vs(-self.I2b / self.B21)
+        return Vs(-self.I2b / self.B[1, 0])
 
-    @property
+    @_cached_property
     def I1g(self):
-        return Is(-self.I2b / self.B22)
+        return Is(-self.I2b / self.B[1, 1])
 
-    @property
+    @_cached_property
     def V2g(self):
-        return Vs(self.V2b - self.B12 / self.B22 * self.I2b)
+        B = self.B
+        return Vs(self.V2b - B[0, 1] / B[1, 1] * self.I2b)
 
-    @property
+    @_cached_property
     def V1h(self):
-        return Vs(-self.V2b / self.B11)
+        return Vs(-self.V2b / self.B[0, 0])
 
-    @property
+    @_cached_property
     def I2h(self):
-        return Is(-self.V2b * self.B21 / self.B11) - self.I2b
+        B = self.B
+        return Is(-self.V2b * B[1, 0] / B[0, 0]) - self.I2b
 
-    @property
+    @_cached_property
     def I1y(self):
-        return Is(-self.V2b / self.B12)
+        return Is(-self.V2b / self.B[0, 1])
 
-    @property
+    @_cached_property
     def I2y(self):
-        return Is(self.V2b * self.B22 / self.B12) - self.I2b
+        B = self.B
+        return Is(self.V2b * B[1, 1] / B[0, 1]) - self.I2b
 
-    @property
+    @_cached_property
     def V1z(self):
-        return Vs(-self.I2b / self.B21)
+        return Vs(-self.I2b / self.B[1, 0])
 
-    @property
+    @_cached_property
     def V2z(self):
-        return self.V2b - Vs(self.I2b * self.B11 / self.B21)
+        B = self.B
+        return self.V2b - Vs(self.I2b * B[0, 0] / B[1, 0])
 
     @property
     def Yoc(self):
@@ -1080,17 +1339,17 @@ class TwoPort(Network):
     @property
     def Ysc(self):
         """Return admittance vector with ports short circuit"""
-        return self.Y.Ysc
+        return YsVector(self.Y1sc, self.Y2sc)
 
     @property
     def Y1sc(self):
         """Return input admittance with output port short circuit"""
-        return Ys(self.Ysc[0])
+        return Ys(self._M.Y1sc)
 
     @property
     def Y2sc(self):
         """Return output admittance with output port short circuit"""
-        return Ys(self.Ysc[1])
+        return Ys(self._M.Y2sc)
 
     @property
     def Zoc(self):
@@ -1190,20 +1449,23 @@ class TwoPort(Network):
         """Return voltage response for specified applied voltage and
         specified ports"""
 
-        if issubclass(V.__class__, OnePort):
+        if isinstance(V, OnePort):
             V = V.Voc
 
         p1 = inport - 1
         p2 = outport - 1
 
-        H = self.Z[p2, p1] / self.Z[p1, p1]
-        return Vs(self.Voc[p2] + (V - self.Voc[p1]) * H)
+        Z = self.Z
+        Voc = self.Voc
+
+        H = Z[p2, p1] / Z[p1, p1]
+        return Vs(Voc[p2] + (V - Voc[p1]) * H)
 
     def Iresponse(self, I, inport=1, outport=2):
         """Return current response for specified applied current and
         specified ports"""
 
-        if issubclass(I.__class__, OnePort):
+        if isinstance(I, OnePort):
             I = I.Isc
 
         p1 = inport - 1
@@ -1325,7 +1587,7 @@ class TwoPort(Network):
         """Return the model with, TP, appended (cascade or
         chain connection)"""
 
-        if not issubclass(TP.__class__, TwoPort):
+        if not isinstance(TP, TwoPort):
             raise TypeError('Argument not', TwoPort)
 
         return Chain(self, TP)
@@ -1353,7 +1615,7 @@ class TwoPort(Network):
          shorts out the top of the T of the second two-port.
          """
 
-        if issubclass(TP.__class__, OnePort):
+        if isinstance(TP, OnePort):
             raise NotImplementedError('TODO')
 
         warn('Do you mean chain?  The result of a series combination'
@@ -1374,7 +1636,7 @@ class TwoPort(Network):
     def parallel(self, TP, port=None):
         """Return the model with, TP, in parallel"""
 
-        if issubclass(TP.__class__, OnePort):
+        if isinstance(TP, OnePort):
             raise NotImplementedError('TODO')
 
         return Par2(self, TP)
@@ -1383,7 +1645,7 @@ class TwoPort(Network):
         """Return the model with, TP, in hybrid connection (series
         input, parallel output)"""
 
-        if issubclass(TP.__class__, OnePort):
+        if isinstance(TP, OnePort):
             raise NotImplementedError('TODO')
 
         return Hybrid2(self, TP)
@@ -1392,7 +1654,7 @@ class TwoPort(Network):
         """Return the model with, TP, in inverse hybrid connection
         (parallel input, series output)"""
 
-        if issubclass(TP.__class__, OnePort):
+        if isinstance(TP, OnePort):
             raise NotImplementedError('TODO')
 
         return InverseHybrid2(self, TP)
@@ -1403,7 +1665,7 @@ class TwoPort(Network):
     def bridge(self, TP):
         """Bridge the ports with a one-port element"""
 
-        if not issubclass(TP.__class__, OnePort):
+        if not isinstance(TP, OnePort):
             raise TypeError('Argument not ', OnePort)
 
         # FIXME
@@ -1412,7 +1674,7 @@ class TwoPort(Network):
     def load(self, TP):
         """Apply a one-port load and return a Thevenin (one-port) object"""
 
-        if not issubclass(TP.__class__, OnePort):
+        if not isinstance(TP, OnePort):
             raise TypeError('Argument not ', OnePort)
 
         foo = self.chain(Shunt(TP))
@@ -1421,7 +1683,7 @@ class TwoPort(Network):
     def source(self, TP):
         """Apply a one-port source and return a Thevenin (one-port) object"""
 
-        if not issubclass(TP.__class__, OnePort):
+        if not isinstance(TP, OnePort):
             raise TypeError('Argument not ', OnePort)
 
         foo = Shunt(TP).chain(self)
@@ -1431,9 +1693,9 @@ class TwoPort(Network):
         """Apply a short-circuit to specified port and return a
         one-port object"""
 
-        p = port - 1
-        Yval = self.Y[1 - p, 1 - p]
-        Ival = self.Isc[1 - p]
+        # The per-port closed forms avoid converting the full Y matrix.
+        Yval = self.Y1sc if port == 2 else self.Y2sc
+        Ival = self.Isc[2 - port]
 
         return Y(Yval) | I(Ival)
 
@@ -1441,15 +1703,17 @@ class TwoPort(Network):
         """Apply a open-circuit to specified port and return a
         one-port object"""
 
-        p = port - 1
-        Zval = self.Z[1 - p, 1 - p]
-        Vval = self.Voc[1 - p]
+        # The per-port closed forms avoid converting the full Z matrix.
+        Zval = self.Z1oc if port == 2 else self.Z2oc
+        Vval = self.Voc[2 - port]
 
         return Z(Zval) + V(Vval)
 
     def simplify(self):
 
-        if self.B == sym.eye(2):
+        B = self.B
+        if (_is_one(B[0, 0]) and _is_zero(B[0, 1])
+                and _is_zero(B[1, 0]) and _is_one(B[1, 1])):
             # Have a pair of wires... perhaps could simplify
             # to an LSection comprised of a V and I but
             # may have a weird voltage expression.
@@ -1516,10 +1780,13 @@ class TwoPortBModel(TwoPort):
     # problem, however, they cannot be extended to three or more ports.
     #
 
-    def __init__(self, B, V2b=Vs(0), I2b=Is(0)):
+    def __init__(self, B, V2b=_VS_ZERO, I2b=_IS_ZERO):
 
-        if issubclass(B.__class__, TwoPortBModel):
-            B, V2b, I2b = B._M, B._V2b, B._I2b
+        if isinstance(B, TwoPortBModel):
+            # Use the public accessors so subclasses that compute
+            # their sources lazily (such as Chain) are copied
+            # correctly.
+            B, V2b, I2b = B._M, B.V2b, B.I2b
 
         if not isinstance(B, BMatrix):
             raise ValueError('B not BMatrix')
@@ -1548,29 +1815,32 @@ class TwoPortBModel(TwoPort):
     def V2b(self):
         return self._V2b
 
-    @property
+    @_cached_property
     def V1h(self):
-        return Vs(-self.V2b / self.B11)
+        return Vs(-self.V2b / self._M[0, 0])
 
-    @property
+    @_cached_property
     def I2h(self):
-        return Is(-self.V2b * self.B21 / self.B11) - self.I2b
+        B = self._M
+        return Is(-self.V2b * B[1, 0] / B[0, 0]) - self.I2b
 
-    @property
+    @_cached_property
     def I1y(self):
-        return Is(-self.V2b / self.B12)
+        return Is(-self.V2b / self._M[0, 1])
 
-    @property
+    @_cached_property
     def I2y(self):
-        return Is(self.V2b * self.B22 / self.B12) - self.I2b
+        B = self._M
+        return Is(self.V2b * B[1, 1] / B[0, 1]) - self.I2b
 
-    @property
+    @_cached_property
     def V1z(self):
-        return Vs(-self.I2b / self.B21)
+        return Vs(-self.I2b / self._M[1, 0])
 
-    @property
+    @_cached_property
     def V2z(self):
-        return self.V2b - Vs(self.I2b * self.B11 / self.B21)
+        B = self._M
+        return self.V2b - Vs(self.I2b * B[0, 0] / B[1, 0])
 
 
 class TwoPortGModel(TwoPort):
@@ -1578,9 +1848,9 @@ class TwoPortGModel(TwoPort):
     """
     """
 
-    def __init__(self, G, I1g=Is(0), V2g=Vs(0)):
+    def __init__(self, G, I1g=_IS_ZERO, V2g=_VS_ZERO):
 
-        if issubclass(G.__class__, TwoPortGModel):
+        if isinstance(G, TwoPortGModel):
             G, I1g, V2g = G._M, G._I1g, G._V2g
 
         if not isinstance(G, GMatrix):
@@ -1602,19 +1872,20 @@ class TwoPortGModel(TwoPort):
         """Return hybrid matrix"""
         return self._M
 
-    @property
+    @_cached_property
     def V2b(self):
         """Return V2b"""
 
         # FIXME
-        return Vs(self.I1g / self.G.G12)
+        return Vs(self.I1g / self._M[0, 1])
 
-    @property
+    @_cached_property
     def I2b(self):
         """Return I2b"""
 
         # FIXME
-        return Is(self.G.G22 / self.G.G12 * self.I1g) - self.V2g
+        G = self._M
+        return Is(G[1, 1] / G[0, 1] * self.I1g) - self.V2g
 
     @property
     def I1g(self):
@@ -1651,9 +1922,9 @@ class TwoPortHModel(TwoPort):
     +-  -+     +-        -+   +-  -+     +-   -+
     """
 
-    def __init__(self, H, V1h=Vs(0), I2h=Is(0)):
+    def __init__(self, H, V1h=_VS_ZERO, I2h=_IS_ZERO):
 
-        if issubclass(H.__class__, TwoPortHModel):
+        if isinstance(H, TwoPortHModel):
             H, V1h, I2h = H._M, H._V1h, H._I2h
 
         if not isinstance(H, HMatrix):
@@ -1675,17 +1946,18 @@ class TwoPortHModel(TwoPort):
         """Return hybrid matrix"""
         return self._M
 
-    @property
+    @_cached_property
     def V2b(self):
         """Return V2b"""
 
-        return Vs(self.V1h / self.H.H12)
+        return Vs(self.V1h / self._M[0, 1])
 
-    @property
+    @_cached_property
     def I2b(self):
         """Return I2b"""
 
-        return Is(self.H.H22 / self.H.H12 * self.V1h) - self.I2h
+        H = self._M
+        return Is(H[1, 1] / H[0, 1] * self.V1h) - self.I2h
 
     @property
     def V1h(self):
@@ -1723,9 +1995,9 @@ class TwoPortYModel(TwoPort):
     Ymn = Im / Vn for Vm = 0
     """
 
-    def __init__(self, Y, I1y=Is(0), I2y=Is(0)):
+    def __init__(self, Y, I1y=_IS_ZERO, I2y=_IS_ZERO):
 
-        if issubclass(Y.__class__, TwoPortYModel):
+        if isinstance(Y, TwoPortYModel):
             Y, I1y, I2y = Y._M, Y._I1y, Y._I2y
 
         if not isinstance(Y, YMatrix):
@@ -1746,13 +2018,15 @@ class TwoPortYModel(TwoPort):
         """Return admittance matrix"""
         return self._M
 
-    @property
+    @_cached_property
     def I2b(self):
-        return Is(-self.I1y * self.Y11 * self.Y22 / self.Y12) - self.I2y
+        Y = self._M
+        return Is(-self.I1y * Y[0, 0] * Y[1, 1] / Y[0, 1]) - self.I2y
 
-    @property
+    @_cached_property
     def V2b(self):
-        return Vs(self.I1y * self.Y11 / self.Y22)
+        Y = self._M
+        return Vs(self.I1y * Y[0, 0] / Y[1, 1])
 
     @property
     def I1y(self):
@@ -1789,9 +2063,9 @@ class TwoPortZModel(TwoPort):
 
     """
 
-    def __init__(self, Z, V1z=Vs(0), V2z=Vs(0)):
+    def __init__(self, Z, V1z=_VS_ZERO, V2z=_VS_ZERO):
 
-        if issubclass(Z.__class__, TwoPortZModel):
+        if isinstance(Z, TwoPortZModel):
             Z, V1z, V2z = Z._M, Z._V1z, Z._V2z
 
         if not isinstance(Z, ZMatrix):
@@ -1812,25 +2086,28 @@ class TwoPortZModel(TwoPort):
         """Return impedance matrix"""
         return self._M
 
-    @property
+    @_cached_property
     def I2b(self):
-        return Is(self.V1z / self.Z12)
+        return Is(self.V1z / self._M[0, 1])
 
-    @property
+    @_cached_property
     def V2b(self):
-        return self.V2z - Vs(self.V1z * self.Z22 / self.Z12)
+        Z = self._M
+        return self.V2z - Vs(self.V1z * Z[1, 1] / Z[0, 1])
 
-    @property
+    @_cached_property
     def I1y(self):
 
-        Zdet = self.Z.det()
-        return Is(-self.V1z * self.Z22 / Zdet - self.V2z * self.Z12 / Zdet)
+        Z = self._M
+        Zdet = Z._det
+        return Is(-self.V1z * Z[1, 1] / Zdet - self.V2z * Z[0, 1] / Zdet)
 
-    @property
+    @_cached_property
     def I2y(self):
 
-        Zdet = self.Z.det()
-        return Is(self.V1z * self.Z21 / Zdet - self.V2z * self.Z11 / Zdet)
+        Z = self._M
+        Zdet = Z._det
+        return Is(self.V1z * Z[1, 0] / Zdet - self.V2z * Z[0, 0] / Zdet)
 
     @property
     def V1z(self):
@@ -1847,33 +2124,68 @@ class Chain(TwoPortBModel):
 
     def __init__(self, *args):
 
-        self.args = args
-        self._check_twoport_args()
+        # Flatten nested chains so a cascade built by repeated chain()
+        # calls folds in a single pass over all the stages instead of
+        # through a binary tree of intermediate products.
+        flat = []
+        for arg in args:
+            if isinstance(arg, Chain):
+                flat.extend(arg.args)
+            else:
+                flat.append(arg)
+        self.args = args = tuple(flat)
+
+        if len(args) < 2:
+            raise ValueError('At least two args required for Chain')
+        for arg in args:
+            if not isinstance(arg, TwoPort):
+                raise ValueError('%s not a TwoPort' % arg)
+
+        # Only fold the chain matrices here; the sources are folded
+        # lazily since transfer-function queries never need them.
+        B = args[-1].B
+        for arg in reversed(args[0:-1]):
+            B = _mul2x2(BMatrix, B, arg.B)
 
+        super(Chain, self).__init__(B)
+
+    @_cached_property
+    def _sources(self):
+
+        args = self.args
         arg1 = args[-1]
         B = arg1.B
+        v, i = arg1.V2b, arg1.I2b
 
-        foo = Vector(arg1.V2b, arg1.I2b)
-
+        # Fold the cascade with scalar 2 x 2 operations; sympy's
+        # generic matrix product and a Vector per stage are far more
+        # expensive.
         for arg in reversed(args[0:-1]):
 
-            foo += B * Vector(arg.V2b, arg.I2b)
-            B = B * arg.B
+            V2b, I2b = arg.V2b, arg.I2b
+            v = v + B[0, 0] * V2b + B[0, 1] * I2b
+            i = i + B[1, 0] * V2b + B[1, 1] * I2b
+            B = _mul2x2(BMatrix, B, arg.B)
 
-        super(Chain, self).__init__(B, Vs(foo[0, 0]), Is(foo[1, 0]))
+        return Vs(v), Is(i)
 
-    def simplify(self):
+    @property
+    def V2b(self):
+        return self._sources[0]
 
-        if isinstance(self.args[0], Shunt) and isinstance(self.args[1], Shunt):
-            return Shunt(
-                (self.args[0].args[0] | self.args[1].args[0]).simplify())
+    @property
+    def I2b(self):
+        return self._sources[1]
 
-        if isinstance(self.args[0], Series) and isinstance(
-                self.args[1], Series):
-            return Series(
-                (self.args[0].args[0] + self.args[1].args[0]).simplify())
+    def simplify(self):
 
-        return self
+        # The rules reduce exactly two stages; a flattened chain can
+        # carry more and must not drop the extras.
+        if len(self.args) != 2:
+            return self
+        rule = _chain_simplify_rules.get((type(self.args[0]),
+                                          type(self.args[1])))
+        return rule(self.args[0], self.args[1]) if rule is not None else self
 
 
 class Par2(TwoPortYModel):
@@ -1891,30 +2203,20 @@ class Par2(TwoPortYModel):
         if isinstance(args[0], Shunt) or isinstance(args[1], Shunt):
             print('Warning: need to handle a Shunt in parallel')
 
-        arg = args[0]
-        I1y = arg.I1y
-        I2y = arg.I2y
-        Y = arg.Y
-
-        for arg in args[1:]:
-            I1y += arg.I1y
-            I2y += arg.I2y
-            Y += arg.Y
+        # One sympy Add per quantity instead of pairwise sums.
+        I1y = Is(sym.Add(*[_expr(arg.I1y) for arg in args]))
+        I2y = Is(sym.Add(*[_expr(arg.I2y) for arg in args]))
+        mats = [arg.Y for arg in args]
+        Y = YMatrix(*[sym.Add(*[_expr(M[i, j]) for M in mats])
+                      for i in (0, 1) for j in (0, 1)])
 
         super(Par2, self).__init__(Y, I1y, I2y)
 
     def simplify(self):
 
-        if isinstance(self.args[0], Shunt) and isinstance(self.args[1], Shunt):
-            return Shunt(
-                (self.args[0].args[0] | self.args[1].args[0]).simplify())
-
-        if isinstance(self.args[0], Series) and isinstance(
-                self.args[1], Series):
-            return Series(
-                (self.args[0].args[0] | self.args[1].args[0]).simplify())
-
-        return self
+        rule = _par2_simplify_rules.get((type(self.args[0]),
+                                         type(self.args[1])))
+        return rule(self.args[0], self.args[1]) if rule is not None else self
 
 
 class Ser2(TwoPortZModel):
@@ -1931,25 +2233,20 @@ class Ser2(TwoPortZModel):
         if isinstance(self.args[1], (Series, LSection, TSection)):
             print('Warning: This can violate the port condition')
 
-        arg = args[0]
-        V1z = arg.V1z
-        V2z = arg.V2z
-        Z = arg.Z
-
-        for arg in args[1:]:
-            V1z += arg.V1z
-            V2z += arg.V2z
-            Z += arg.Z
+        # One sympy Add per quantity instead of pairwise sums.
+        V1z = Vs(sym.Add(*[_expr(arg.V1z) for arg in args]))
+        V2z = Vs(sym.Add(*[_expr(arg.V2z) for arg in args]))
+        mats = [arg.Z for arg in args]
+        Z = ZMatrix(*[sym.Add(*[_expr(M[i, j]) for M in mats])
+                      for i in (0, 1) for j in (0, 1)])
 
         super(Ser2, self).__init__(Z, V1z, V2z)
 
     def simplify(self):
 
-        if isinstance(self.args[0], Shunt) and isinstance(self.args[1], Shunt):
-            return Shunt(
-                (self.args[0].args[0] + self.args[1].args[0]).simplify())
-
-        return self
+        rule = _ser2_simplify_rules.get((type(self.args[0]),
+                                         type(self.args[1])))
+        return rule(self.args[0], self.args[1]) if rule is not None else self
 
 
 class Hybrid2(TwoPortHModel):
@@ -1962,15 +2259,12 @@ class Hybrid2(TwoPortHModel):
         self.args = args
         self._check_twoport_args()
 
-        arg = args[0]
-        V1h = arg.V1h
-        I2h = arg.I2h
-        H = arg.H
-
-        for arg in args[1:]:
-            V1h += arg.V1h
-            I2h += arg.I2h
-            H += arg.H
+        # One sympy Add per quantity instead of pairwise sums.
+        V1h = Vs(sym.Add(*[_expr(arg.V1h) for arg in args]))
+        I2h = Is(sym.Add(*[_expr(arg.I2h) for arg in args]))
+        mats = [arg.H for arg in args]
+        H = HMatrix(*[sym.Add(*[_expr(M[i, j]) for M in mats])
+                      for i in (0, 1) for j in (0, 1)])
 
         super(Hybrid2, self).__init__(H, V1h, I2h)
 
@@ -1985,17 +2279,14 @@ class InverseHybrid2(TwoPortGModel):
         self.args = args
         self._check_twoport_args()
 
-        arg = args[0]
-        I1g = arg.I1g
-        V2g = arg.V2g
-        G = arg.G
+        # One sympy Add per quantity instead of pairwise sums.
+        I1g = Is(sym.Add(*[_expr(arg.I1g) for arg in args]))
+        V2g = Vs(sym.Add(*[_expr(arg.V2g) for arg in args]))
+        mats = [arg.G for arg in args]
+        G = GMatrix(*[sym.Add(*[_expr(M[i, j]) for M in mats])
+                      for i in (0, 1) for j in (0, 1)])
 
-        for arg in args[1:]:
-            I1g += arg.I1g
-            V2g += arg.V2g
-            G += arg.G
-
-        super(Hybrid2, self).__init__(G, I1g, V2g)
+        super(InverseHybrid2, self).__init__(G, I1g, V2g)
 
 
 class Series(TwoPortBModel):
@@ -2013,12 +2304,31 @@ class Series(TwoPortBModel):
     Note, this has a singular Y matrix.
     """
 
+    # A series element is a series network by construction.
+    isseries = True
+
     def __init__(self, OP):
 
         self.OP = OP
         self.args = (OP, )
         _check_oneport_args(self.args)
-        super(Series, self).__init__(BMatrix.Zseries(OP.Z), Vs(OP.Voc), Is(0))
+        super(Series, self).__init__(BMatrix.Zseries(OP.Z), Vs(OP.Voc),
+                                     _IS_ZERO)
+
+    @_cached_property
+    def Y(self):
+        """Return admittance matrix"""
+        Y = self.OP.Y
+        return YMatrix(Y, -Y, -Y, Y)
+
+    @_cached_property
+    def H(self):
+        """Return hybrid matrix"""
+        return HMatrix(self.OP.Z, 1, -1, 0)
+
+    @property
+    def Z(self):
+        raise ValueError('Series two-port has no Z matrix representation')
 
 
 class Shunt(TwoPortBModel):
@@ -2040,12 +2350,50 @@ class Shunt(TwoPortBModel):
     Note, this has a singular Z matrix.
     """
 
+    # A shunt element is a shunt network by construction.
+    isshunt = True
+
     def __init__(self, OP):
 
         self.OP = OP
         self.args = (OP, )
         _check_oneport_args(self.args)
-        super(Shunt, self).__init__(BMatrix.Yshunt(OP.Y), Vs(0), Is(OP.Isc))
+        super(Shunt, self).__init__(BMatrix.Yshunt(OP.Y), _VS_ZERO,
+                                    Is(OP.Isc))
+
+    @_cached_property
+    def Z(self):
+        """Return impedance matrix"""
+        Z = self.OP.Z
+        return ZMatrix(Z, Z, Z, Z)
+
+    @_cached_property
+    def H(self):
+        """Return hybrid matrix"""
+        return HMatrix(0, 1, -1, self.OP.Y)
+
+    @property
+    def Y(self):
+        raise ValueError('Shunt two-port has no Y matrix representation')
+
+
+# Reduction rules for the two-argument combinators, keyed on the exact
+# types of the arguments.  A single dict lookup replaces a chain of
+# isinstance tests and new patterns can be added without slowing the
+# existing ones.  Populated here since the rules need Series and Shunt.
+_chain_simplify_rules = {
+    (Shunt, Shunt): lambda a, b: Shunt((a.args[0] | b.args[0]).simplify()),
+    (Series, Series): lambda a, b: Series((a.args[0] + b.args[0]).simplify()),
+}
+
+_par2_simplify_rules = {
+    (Shunt, Shunt): lambda a, b: Shunt((a.args[0] | b.args[0]).simplify()),
+    (Series, Series): lambda a, b: Series((a.args[0] | b.args[0]).simplify()),
+}
+
+_ser2_simplify_rules = {
+    (Shunt, Shunt): lambda a, b: Shunt((a.args[0] + b.args[0]).simplify()),
+}
 
 
 class IdealTransformer(TwoPortBModel):
@@ -2058,6 +2406,28 @@ class IdealTransformer(TwoPortBModel):
         self.args = (alpha, )
         super(IdealTransformer, self).__init__(BMatrix.transformer(alpha))
 
+    @_cached_property
+    def H(self):
+        """Return hybrid matrix"""
+        alpha = self.alpha
+        return HMatrix(0, 1 / alpha, -1 / alpha, 0)
+
+    @_cached_property
+    def G(self):
+        """Return inverse hybrid matrix"""
+        alpha = self.alpha
+        return GMatrix(0, -alpha, alpha, 0)
+
+    @property
+    def Y(self):
+        raise ValueError(
+            'IdealTransformer has no Y matrix representation')
+
+    @property
+    def Z(self):
+        raise ValueError(
+            'IdealTransformer has no Z matrix representation')
+
 
 class TF(IdealTransformer):
     pass
@@ -2260,12 +2630,18 @@ class TSection(TwoPortBModel):
       [      R2, R2 + R3]
     """
 
-    def __init__(self, OP1, OP2, OP3):
+    def __init__(self, OP1, OP2, OP3, **kwargs):
 
         self.args = (OP1, OP2, OP3)
-        _check_oneport_args(self.args)
+        # Internal callers with already validated args pass
+        # _checked=True to skip re-validation.  Keyword only so a
+        # stray positional arg cannot disable the checks.
+        if not _pop_checked(kwargs):
+            _check_oneport_args(self.args)
+
+        # Closed form of Series(OP1).chain(Shunt(OP2)).chain(Series(OP3)).
         super(TSection, self).__init__(
-            Series(OP1).chain(Shunt(OP2)).chain(Series(OP3)))
+            *_fold_ladder([(True, OP1), (False, OP2), (True, OP3)]))
 
     def Pisection(self):
 
@@ -2309,8 +2685,12 @@ class TwinTSection(TwoPortBModel):
         self.args = (OP1a, OP2a, OP3a, OP1b, OP2b, OP3b)
         _check_oneport_args(self.args)
 
-        super(TwinTSection, self).__init__(
-            TSection(OP1a, OP2a, OP3a).parallel(TSection(OP1b, OP2b, OP3b)))
+        # Fold the parallel combination back into B form; the Par2
+        # result is a Y model and cannot be passed to TwoPortBModel
+        # directly.
+        tp = TSection(OP1a, OP2a, OP3a, _checked=True).parallel(
+            TSection(OP1b, OP2b, OP3b, _checked=True))
+        super(TwinTSection, self).__init__(tp.B, tp.V2b, tp.I2b)
 
 
 class BridgedTSection(TwoPortBModel):
@@ -2340,8 +2720,10 @@ class BridgedTSection(TwoPortBModel):
         self.args = (OP1, OP2, OP3, OP4)
         _check_oneport_args(self.args)
 
-        super(TwinTSection, self).__init__(
-            TSection(OP1, OP2, OP3).parallel(Series(OP4)))
+        # Fold the parallel combination back into B form (and name the
+        # right class in the super call).
+        tp = TSection(OP1, OP2, OP3, _checked=True).parallel(Series(OP4))
+        super(BridgedTSection, self).__init__(tp.B, tp.V2b, tp.I2b)
 
 
 class PiSection(TwoPortBModel):
@@ -2364,8 +2746,9 @@ class PiSection(TwoPortBModel):
 
     def __init__(self, OP1, OP2, OP3):
 
+        # Closed form of Shunt(OP1).chain(Series(OP2)).chain(Shunt(OP3)).
         super(PiSection, self).__init__(
-            Shunt(OP1).chain(Series(OP2)).chain(Shunt(OP3)))
+            *_fold_ladder([(False, OP1), (True, OP2), (False, OP3)]))
         self.args = (OP1, OP2, OP3)
 
     def Tsection(self):
@@ -2393,12 +2776,18 @@ class LSection(TwoPortBModel):
          ----------------+----
     """
 
-    def __init__(self, OP1, OP2):
+    def __init__(self, OP1, OP2, **kwargs):
 
         self.args = (OP1, OP2)
-        _check_oneport_args(self.args)
+        # Internal callers with already validated args pass
+        # _checked=True to skip re-validation.  Keyword only so a
+        # stray positional arg cannot disable the checks.
+        if not _pop_checked(kwargs):
+            _check_oneport_args(self.args)
 
-        super(LSection, self).__init__(Series(OP1).chain(Shunt(OP2)))
+        # Closed form of Series(OP1).chain(Shunt(OP2)).
+        super(LSection, self).__init__(
+            *_fold_ladder([(True, OP1), (False, OP2)]))
 
 
 class Ladder(TwoPortBModel):
@@ -2419,37 +2808,103 @@ class Ladder(TwoPortBModel):
          ----------------+-----------------
     """
 
-    def __init__(self, OP1, *args):
+    def __init__(self, OP1, *args, **kwargs):
 
-        self.args = (OP1, ) + args
-        _check_oneport_args(self.args)
+        # A single starred tuple avoids the intermediate concatenation.
+        self.args = (OP1, *args)
+        # Internal callers with already validated args pass
+        # _checked=True to skip re-validation.
+        if not _pop_checked(kwargs):
+            _check_oneport_args(self.args)
 
-        TP = Series(OP1)
+        # Fold the ladder by hand rather than chaining Series and
+        # Shunt objects; the parity bit selects series or shunt
+        # directly without a branch per element.
+        elements = [(True, OP1)] + [(bool(m & 1), arg)
+                                    for m, arg in enumerate(args)]
 
-        for m, arg in enumerate(args):
+        super(Ladder, self).__init__(*_fold_ladder(elements))
 
-            if m & 1:
-                TP = TP.chain(Series(arg))
-            else:
-                TP = TP.chain(Shunt(arg))
+    # The short reductions keyed on the number of elements; the args
+    # were validated on construction so re-validation is skipped.
+    _simplify_dispatch = {
+        1: lambda args: Series(args[0]),
+        2: lambda args: LSection(*args, _checked=True),
+        3: lambda args: TSection(*args, _checked=True),
+    }
+
+    @_cached_property
+    def _simplified(self):
 
-        super(Ladder, self).__init__(TP)
+        rule = self._simplify_dispatch.get(len(self.args))
+        return rule(self.args) if rule is not None else self
 
     def simplify(self):
 
-        if len(self.args) == 1:
-            return Series(self.args[0])
-        elif len(self.args) == 2:
-            return LSection(*self.args)
-        elif len(self.args) == 3:
-            return TSection(*self.args)
-        return self
+        return self._simplified
 
         # A Ladder of voltage sources and current sources
         # collapses to a single Lsection comprised of the total
         # voltage and total current.
 
 
+_convert_cache = {}
+
+
+def _cached_convert(cls, arg):
+    """Convert arg to the expression class cls, memoized on the
+    argument so repeated constructions with the same parameters skip
+    sympify."""
+
+    if isinstance(arg, cls):
+        return arg
+    try:
+        key = (cls, type(arg), arg)
+        return _convert_cache[key]
+    except TypeError:
+        # Unhashable argument; convert directly.
+        return cls(arg)
+    except KeyError:
+        pass
+    result = _convert_cache[key] = cls(arg)
+    return result
+
+
+_txline_cache = {}
+
+
+def _txline_bmatrix(Z0, gamma, l, _cache=_txline_cache,
+                    _cosh=sym.cosh, _sinh=sym.sinh):
+    """Build the four B matrix entries of a transmission line,
+    memoized on the parameters so repeated lines with the same Z0,
+    gamma and l share one set of expressions.  The cache and the
+    hyperbolic constructors are bound as defaults to keep global
+    lookups off the construction path."""
+
+    key = (Z0, gamma, l)
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable parameter; skip the cache.
+        key = None
+
+    # cosh and sinh keep the entries compact; the equivalent
+    # (exp(x) +/- exp(-x)) / 2 forms are much more expensive to
+    # simplify once lines are chained.
+    gl = _expr(gamma) * _expr(l)
+    ch = _cosh(gl)
+    sh = _sinh(gl)
+    Z0 = _expr(Z0)
+
+    # B22 equals B11 so the expression is shared.
+    entries = (ch, -sh * Z0, -sh / Z0, ch)
+    if key is not None:
+        _cache[key] = entries
+    return entries
+
+
 class GeneralTxLine(TwoPortBModel):
 
     """General transmission line
@@ -2461,18 +2916,12 @@ class GeneralTxLine(TwoPortBModel):
 
     def __init__(self, Z0, gamma, l):
 
-        Z0 = sExpr(Z0)
-        gamma = sExpr(gamma)
-        l = cExpr(l)
+        Z0 = _cached_convert(sExpr, Z0)
+        gamma = _cached_convert(sExpr, gamma)
+        l = _cached_convert(cExpr, l)
 
-        H = sym.exp(gamma * l)
-
-        B11 = 0.5 * (H + 1 / H)
-        B12 = 0.5 * (1 / H - H) * Z0
-        B21 = 0.5 * (1 / H - H) / Z0
-        B22 = 0.5 * (H + 1 / H)
-
-        super(GeneralTxLine, self).__init__(BMatrix(B11, B12, B21, B22))
+        super(GeneralTxLine, self).__init__(
+            BMatrix._trusted(_txline_bmatrix(Z0, gamma, l)))
         self.args = (Z0, gamma, l)
 
 
@@ -2504,9 +2953,32 @@ class TxLine(GeneralTxLine):
 
     def __init__(self, R, L, G, C, l=1):
 
-        Z = R + s * L
-        Y = G + s * C
-        gamma = sym.sqrt(Z * Y)
-        Z0 = sym.sqrt(Z / Y)
+        Z = _expr(R + s * L)
+        Y = _expr(G + s * C)
+
+        # Share the Z * Y product between the propagation constant and
+        # the characteristic impedance: sqrt(Z / Y) = sqrt(Z * Y) / Y.
+        gamma = sym.sqrt(sym.together(Z * Y))
+        Z0 = gamma / Y
 
         super(TxLine, self).__init__(Z0, gamma, l)
+
+    @classmethod
+    def vectorized(cls, R, L, G, C, l, svals):
+        """Numerically evaluate the four B matrix entries for numeric
+        line parameters at the vector of Laplace-variable values
+        `svals`.  The parameters may be numpy arrays to sweep them;
+        everything broadcasts together and the 2 x 2 matrices are
+        returned in the trailing dimensions, as for evaluate().  This
+        computes a whole sweep in a handful of numpy operations
+        instead of one symbolic construction per operating point."""
+
+        svals = np.asarray(svals, dtype=complex)
+        Z = R + svals * L
+        Y = G + svals * C
+        gamma = np.sqrt(Z * Y)
+        Z0 = gamma / Y
+        gl = gamma * l
+        ch = np.cosh(gl)
+        sh = np.sinh(gl)
+        return _stack22((ch, -sh * Z0, -sh / Z0, ch))